@@ -0,0 +1,66 @@
+"""
+Shared pooled HTTP clients for all OpenAI calls.
+
+Each agent used to build its own OpenAI() client, so every agent hop in
+one orchestrator invocation paid for a cold HTTPX pool and a fresh TLS
+handshake to the same host. All agents now inject the same keep-alive
+pool, so bursts of standup/report/analysis calls reuse warm connections.
+
+Shutdown closes the pools via close_clients() (wired to the FastAPI
+shutdown event in main.py).
+"""
+
+import os
+from typing import Optional
+
+import httpx
+from openai import OpenAI, AsyncOpenAI
+
+HTTPX_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60.0
+)
+HTTPX_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+_SYNC_CLIENT: Optional[OpenAI] = None
+_ASYNC_CLIENT: Optional[AsyncOpenAI] = None
+
+
+def get_sync_client() -> Optional[OpenAI]:
+    """Shared OpenAI client over one pooled httpx.Client; None without a key."""
+    global _SYNC_CLIENT
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    if _SYNC_CLIENT is None:
+        _SYNC_CLIENT = OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(limits=HTTPX_LIMITS, timeout=HTTPX_TIMEOUT)
+        )
+    return _SYNC_CLIENT
+
+
+def get_async_client() -> Optional[AsyncOpenAI]:
+    """Shared AsyncOpenAI client over one pooled httpx.AsyncClient."""
+    global _ASYNC_CLIENT
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(limits=HTTPX_LIMITS, timeout=HTTPX_TIMEOUT)
+        )
+    return _ASYNC_CLIENT
+
+
+async def close_clients() -> None:
+    """Close the shared pools (FastAPI shutdown)."""
+    global _SYNC_CLIENT, _ASYNC_CLIENT
+    if _SYNC_CLIENT is not None:
+        _SYNC_CLIENT.close()
+        _SYNC_CLIENT = None
+    if _ASYNC_CLIENT is not None:
+        await _ASYNC_CLIENT.close()
+        _ASYNC_CLIENT = None
@@ -21,17 +21,99 @@ Operating Principles:
 """
 
 import uuid
-import json
-from typing import List, Dict, Any, Optional
+import time
+import heapq
+import functools
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from typing import List, Dict, Any, NamedTuple, Optional
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy.orm import Session, load_only, sessionmaker
+from sqlalchemy import func, and_, case
 from backend.app.models import (
-    Task, TaskStatus, TaskPriority, Project, ProjectHealth,
+    Task, TaskStatus, TaskPriority, TaskDependency, Project, ProjectHealth,
     Milestone, Goal, GoalStatus, AgentActivity, Employee
 )
 
 
+# Status groupings used by the hot analysis loops and filters; defined once
+# at module scope so per-call list allocations disappear and Python-side
+# membership tests are O(1) hashes.
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.CANCELLED})
+_ACTIVE_STATUSES = (TaskStatus.IN_PROGRESS, TaskStatus.NOT_STARTED)
+_OPEN_STATUSES = (TaskStatus.IN_PROGRESS, TaskStatus.NOT_STARTED, TaskStatus.BLOCKED)
+
+# Integer codes for the enums, materialized once at import so hot loops can
+# compare plain ints (and feed compact arrays) instead of going through the
+# enum descriptor on every row.
+_STATUS_CODE = {s: i for i, s in enumerate(TaskStatus)}
+_PRIO_CODE = {p: i for i, p in enumerate(TaskPriority)}
+_BLOCKED_CODE = _STATUS_CODE[TaskStatus.BLOCKED]
+_CRITICAL_CODE = _PRIO_CODE[TaskPriority.CRITICAL]
+_HIGH_CODE = _PRIO_CODE[TaskPriority.HIGH]
+
+class GoalSummary(NamedTuple):
+    """Fixed-slot goal rollup consumed by the executive dashboard."""
+    total: int
+    on_track: int
+    at_risk: int
+    completed: int
+
+
+class ProjectSummary(NamedTuple):
+    """Fixed-slot project-health rollup consumed by the executive dashboard."""
+    total: int
+    average_health: float
+    declining: int
+
+
+class RiskSummary(NamedTuple):
+    """Fixed-slot risk rollup consumed by the executive dashboard."""
+    level: str
+    high_risk_items: int
+
+
+class CapacitySummary(NamedTuple):
+    """Fixed-slot capacity rollup consumed by the executive dashboard."""
+    overloaded_count: int
+    underutilized_count: int
+    balanced_count: int
+
+
+# How long a memoized analysis result stays valid. Agents are created per
+# request, so this only deduplicates the fan-out within one request
+# (dashboard -> suggestions -> warnings), not across requests.
+ANALYSIS_CACHE_TTL_SECONDS = 30.0
+
+
+def _memoize_analysis(fn):
+    """Cache an analyzer's result on the agent instance for a short TTL.
+
+    Dashboard, proactive-suggestion, and early-warning paths all fan out
+    into the same analyzers; the second caller reuses the first result
+    instead of re-issuing identical SELECTs. Calls that supply pre-fetched
+    tasks bypass the cache.
+    """
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if kwargs.get("tasks") is not None:
+            return fn(self, *args, **kwargs)
+        key = (
+            fn.__name__,
+            args,
+            tuple(sorted((k, v) for k, v in kwargs.items() if k != "tasks"))
+        )
+        now = time.monotonic()
+        hit = self._analysis_cache.get(key)
+        if hit is not None and now - hit[0] < ANALYSIS_CACHE_TTL_SECONDS:
+            return hit[1]
+        result = fn(self, *args, **kwargs)
+        self._analysis_cache[key] = (now, result)
+        return result
+    return wrapper
+
+
 class AnalyticsAutomationAgent:
     """
     Analytics & Automation Agent for data-driven insights and proactive intelligence.
@@ -49,30 +131,57 @@ class AnalyticsAutomationAgent:
         self.risk_threshold = 0.6  # 60% probability triggers suggestions
         self.overload_hours = 45  # Hours threshold for overload
         self.underload_hours = 15  # Hours threshold for underutilization
+        self._analysis_cache: Dict[tuple, tuple] = {}  # See _memoize_analysis
     
     # ==================== PROJECT ANALYTICS ====================
     
+    @_memoize_analysis
     def analyze_project_performance(self, project_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze project health using task completion, milestones, deadlines, blockers.
         
         Outputs: health score, trend, key contributing factors.
         """
-        query = self.db.query(Project)
+        project_query = self.db.query(Project).with_entities(Project.id, Project.name)
         if project_id:
-            query = query.filter(Project.id == project_id)
-        
-        projects = query.all()
-        
+            project_query = project_query.filter(Project.id == project_id)
+
+        projects = project_query.all()
+
         if not projects:
             return {"error": "No projects found", "data_available": False}
-        
+
+        # Aggregate task counts per (project, status) in a single grouped query
+        # instead of one task SELECT per project.
+        now = datetime.utcnow()
+        agg_query = self.db.query(
+            Task.project_id,
+            Task.status,
+            func.count().label("n"),
+            func.sum(
+                case(
+                    (and_(
+                        Task.deadline < now,
+                        Task.status.notin_(_TERMINAL_STATUSES)
+                    ), 1),
+                    else_=0
+                )
+            ).label("overdue")
+        ).group_by(Task.project_id, Task.status)
+        if project_id:
+            agg_query = agg_query.filter(Task.project_id == project_id)
+
+        status_counts: Dict[str, Dict[TaskStatus, int]] = {}
+        overdue_counts: Dict[str, int] = {}
+        for task_project_id, status, count, overdue_n in agg_query:
+            status_counts.setdefault(task_project_id, {})[status] = count
+            overdue_counts[task_project_id] = overdue_counts.get(task_project_id, 0) + (overdue_n or 0)
+
         results = []
         for project in projects:
-            # Get project tasks
-            tasks = self.db.query(Task).filter(Task.project_id == project.id).all()
-            
-            if not tasks:
+            counts = status_counts.get(project.id)
+
+            if not counts:
                 results.append({
                     "project_id": project.id,
                     "project_name": project.name,
@@ -81,20 +190,14 @@ class AnalyticsAutomationAgent:
                     "data_quality": "No tasks found"
                 })
                 continue
-            
+
             # Calculate metrics
-            total_tasks = len(tasks)
-            completed = sum(1 for t in tasks if t.status == TaskStatus.COMPLETED)
-            blocked = sum(1 for t in tasks if t.status == TaskStatus.BLOCKED)
-            in_progress = sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS)
-            
-            # Deadline variance
-            overdue = 0
-            for task in tasks:
-                if task.deadline and task.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]:
-                    if task.deadline < datetime.utcnow():
-                        overdue += 1
-            
+            total_tasks = sum(counts.values())
+            completed = counts.get(TaskStatus.COMPLETED, 0)
+            blocked = counts.get(TaskStatus.BLOCKED, 0)
+            in_progress = counts.get(TaskStatus.IN_PROGRESS, 0)
+            overdue = overdue_counts.get(project.id, 0)
+
             # Calculate health score (0-100)
             completion_rate = (completed / total_tasks) * 100 if total_tasks > 0 else 0
             blocker_rate = (blocked / total_tasks) * 100 if total_tasks > 0 else 0
@@ -149,48 +252,71 @@ class AnalyticsAutomationAgent:
             }
         }
     
-    def analyze_team_workload(self) -> Dict[str, Any]:
+    @_memoize_analysis
+    def analyze_team_workload(self, tasks: Optional[List[Task]] = None) -> Dict[str, Any]:
         """
         Analyze workload distribution across team.
-        
+
         Outputs: workload distribution, overload/underutilization signals, recommendations.
+
+        Accepts pre-fetched tasks so callers like generate_executive_dashboard
+        can share one task query across several analyses.
         """
-        # Get active tasks
-        active_tasks = self.db.query(Task).filter(
-            Task.status.in_([TaskStatus.IN_PROGRESS, TaskStatus.NOT_STARTED])
-        ).all()
-        
-        if not active_tasks:
+        week_from_now = datetime.utcnow() + timedelta(days=7)
+        workload_by_user: Dict[str, Dict] = {}
+
+        if tasks is not None:
+            # Aggregate pre-fetched tasks in Python
+            workload_by_user = defaultdict(lambda: {
+                "task_count": 0,
+                "estimated_hours": 0,
+                "critical_count": 0,
+                "deadlines_this_week": 0
+            })
+            for task in tasks:
+                if task.status not in _ACTIVE_STATUSES:
+                    continue
+                data = workload_by_user[task.owner or "Unassigned"]
+                data["task_count"] += 1
+                data["estimated_hours"] += task.estimated_hours or 4
+
+                if task.priority == TaskPriority.CRITICAL:
+                    data["critical_count"] += 1
+
+                if task.deadline and task.deadline <= week_from_now:
+                    data["deadlines_this_week"] += 1
+        else:
+            # Aggregate per owner in SQL: one grouped query returning a row
+            # per owner instead of hydrating every active task
+            owner_col = func.coalesce(Task.owner, "Unassigned")
+            rows = self.db.query(
+                owner_col.label("owner"),
+                func.count().label("task_count"),
+                func.sum(func.coalesce(Task.estimated_hours, 4)).label("estimated_hours"),
+                func.sum(
+                    case((Task.priority == TaskPriority.CRITICAL, 1), else_=0)
+                ).label("critical_count"),
+                func.sum(
+                    case((Task.deadline <= week_from_now, 1), else_=0)
+                ).label("deadlines_this_week")
+            ).filter(
+                Task.status.in_(_ACTIVE_STATUSES)
+            ).group_by(owner_col).all()
+
+            for row in rows:
+                workload_by_user[row.owner or "Unassigned"] = {
+                    "task_count": row.task_count,
+                    "estimated_hours": row.estimated_hours or 0,
+                    "critical_count": row.critical_count or 0,
+                    "deadlines_this_week": row.deadlines_this_week or 0
+                }
+
+        if not workload_by_user:
             return {
                 "data_available": False,
                 "message": "No active tasks found for analysis"
             }
         
-        # Aggregate by owner
-        workload_by_user: Dict[str, Dict] = {}
-        
-        for task in active_tasks:
-            owner = task.owner or "Unassigned"
-            if owner not in workload_by_user:
-                workload_by_user[owner] = {
-                    "task_count": 0,
-                    "estimated_hours": 0,
-                    "critical_count": 0,
-                    "deadline_density": 0,
-                    "deadlines_this_week": 0
-                }
-            
-            workload_by_user[owner]["task_count"] += 1
-            workload_by_user[owner]["estimated_hours"] += task.estimated_hours or 4
-            
-            if task.priority == TaskPriority.CRITICAL:
-                workload_by_user[owner]["critical_count"] += 1
-            
-            if task.deadline:
-                week_from_now = datetime.utcnow() + timedelta(days=7)
-                if task.deadline <= week_from_now:
-                    workload_by_user[owner]["deadlines_this_week"] += 1
-        
         # Classify workload status
         distribution = []
         overloaded = []
@@ -254,38 +380,45 @@ class AnalyticsAutomationAgent:
         Outputs: trend summaries, root cause indicators.
         """
         cutoff = datetime.utcnow() - timedelta(days=days)
-        
-        # Get completed tasks in period
-        completed_tasks = self.db.query(Task).filter(
+
+        # Get completed tasks in period (only the columns the analysis reads)
+        completed_tasks = self.db.query(Task).with_entities(
+            Task.deadline, Task.updated_at, Task.priority
+        ).filter(
             Task.status == TaskStatus.COMPLETED,
             Task.updated_at >= cutoff
         ).all()
-        
+
         if len(completed_tasks) < 5:
             return {
                 "data_available": False,
                 "confidence": "low",
                 "message": f"Insufficient data: only {len(completed_tasks)} completed tasks in last {days} days"
             }
-        
-        # Analyze delays
-        on_time = 0
-        delayed = 0
-        delay_days_total = 0
-        delays_by_priority: Dict[str, int] = {}
-        
-        for task in completed_tasks:
-            if task.deadline and task.updated_at:
-                if task.updated_at <= task.deadline:
-                    on_time += 1
-                else:
-                    delayed += 1
-                    delay = (task.updated_at - task.deadline).days
-                    delay_days_total += delay
-                    
-                    priority = task.priority.value if task.priority else "unknown"
-                    delays_by_priority[priority] = delays_by_priority.get(priority, 0) + 1
-        
+
+        # Analyze delays with columnar NumPy ops instead of per-row comparisons
+        measured = [t for t in completed_tasks if t.deadline and t.updated_at]
+        delays_by_priority: Counter = Counter()
+
+        if measured:
+            deadlines = np.array([t.deadline for t in measured], dtype="datetime64[s]")
+            updated = np.array([t.updated_at for t in measured], dtype="datetime64[s]")
+
+            delayed_mask = updated > deadlines
+            on_time = int((~delayed_mask).sum())
+            delayed = int(delayed_mask.sum())
+            delay_days_total = int(np.floor(
+                (updated - deadlines)[delayed_mask] / np.timedelta64(1, "D")
+            ).sum())
+
+            for task, is_delayed in zip(measured, delayed_mask):
+                if is_delayed:
+                    delays_by_priority[task.priority.value if task.priority else "unknown"] += 1
+        else:
+            on_time = 0
+            delayed = 0
+            delay_days_total = 0
+
         total = on_time + delayed
         on_time_rate = (on_time / total * 100) if total > 0 else 0
         avg_delay = delay_days_total / delayed if delayed > 0 else 0
@@ -308,7 +441,7 @@ class AnalyticsAutomationAgent:
                 "on_time_rate": round(on_time_rate, 1),
                 "delayed_count": delayed,
                 "average_delay_days": round(avg_delay, 1),
-                "delays_by_priority": delays_by_priority
+                "delays_by_priority": dict(delays_by_priority)
             },
             "root_cause_indicators": root_causes if root_causes else ["No significant patterns detected"],
             "summary": f"{on_time_rate:.0f}% on-time delivery with avg delay of {avg_delay:.1f} days"
@@ -316,105 +449,156 @@ class AnalyticsAutomationAgent:
     
     # ==================== RISK FORECASTING ====================
     
-    def forecast_risks(self, project_id: Optional[str] = None) -> Dict[str, Any]:
+    @_memoize_analysis
+    def forecast_risks(self, project_id: Optional[str] = None,
+                       tasks: Optional[List[Task]] = None) -> Dict[str, Any]:
         """
         Forecast risks using historical patterns, dependencies, and resource availability.
-        
+
         Outputs: risk probability, estimated impact, time-to-risk window.
+
+        Accepts pre-fetched tasks so callers like generate_executive_dashboard
+        can share one task query across several analyses.
         """
-        query = self.db.query(Task).filter(
-            Task.status.in_([TaskStatus.IN_PROGRESS, TaskStatus.NOT_STARTED, TaskStatus.BLOCKED])
-        )
-        
-        if project_id:
-            query = query.filter(Task.project_id == project_id)
-        
-        tasks = query.all()
+        if tasks is not None:
+            tasks = [
+                t for t in tasks
+                if t.status in _OPEN_STATUSES
+                and (project_id is None or t.project_id == project_id)
+            ]
+        else:
+            query = self.db.query(Task).with_entities(
+                Task.id, Task.name, Task.status, Task.deadline,
+                Task.priority, Task.project_id
+            ).filter(
+                Task.status.in_(_OPEN_STATUSES)
+            )
+
+            if project_id:
+                query = query.filter(Task.project_id == project_id)
+
+            tasks = query.all()
         
         if not tasks:
             return {"risks": [], "data_available": False}
-        
+
+        # Count dependencies for all tasks in one grouped query instead of
+        # triggering a lazy relationship load (and a decode) per task.
+        dep_counts: Dict[str, int] = dict(
+            self.db.query(TaskDependency.task_id, func.count())
+            .filter(TaskDependency.task_id.in_([t.id for t in tasks]))
+            .group_by(TaskDependency.task_id)
+            .all()
+        )
+
+        now = datetime.utcnow()
+
+        # Score every task with vectorized array ops, then materialize factor
+        # strings only for the tasks that cross the reporting threshold.
+        no_deadline = np.iinfo(np.int64).max
+        days = np.array(
+            [(t.deadline - now).days if t.deadline else no_deadline for t in tasks],
+            dtype=np.int64
+        )
+        status_codes = np.array([_STATUS_CODE[t.status] for t in tasks], dtype=np.int8)
+        prio_codes = np.array([_PRIO_CODE.get(t.priority, -1) for t in tasks], dtype=np.int8)
+        blocked = status_codes == _BLOCKED_CODE
+        critical = prio_codes == _CRITICAL_CODE
+        dep_count_arr = np.array([dep_counts.get(t.id, 0) for t in tasks], dtype=np.int64)
+
+        overdue_mask = days < 0
+        due_soon_mask = (days >= 0) & (days < 3)
+        due_week_mask = (days >= 3) & (days < 7)
+
+        scores = (
+            overdue_mask * 40 + due_soon_mask * 30 + due_week_mask * 15
+            + blocked * 35 + critical * 20 + (dep_count_arr > 0) * 10
+        )
+
         risks = []
-        
-        for task in tasks:
-            risk_score = 0
+        for i in np.nonzero(scores >= 30)[0]:
+            task = tasks[i]
             risk_factors = []
-            
-            # Check deadline proximity
-            if task.deadline:
-                days_until = (task.deadline - datetime.utcnow()).days
-                if days_until < 0:
-                    risk_score += 40
-                    risk_factors.append(f"Overdue by {abs(days_until)} days")
-                elif days_until < 3:
-                    risk_score += 30
-                    risk_factors.append(f"Due in {days_until} days")
-                elif days_until < 7:
-                    risk_score += 15
-                    risk_factors.append("Due within a week")
-            
-            # Check blockers
-            if task.status == TaskStatus.BLOCKED:
-                risk_score += 35
+            risk_tags = set()
+
+            if overdue_mask[i]:
+                risk_factors.append(f"Overdue by {abs(int(days[i]))} days")
+                risk_tags.add("OVERDUE")
+            elif due_soon_mask[i]:
+                risk_factors.append(f"Due in {int(days[i])} days")
+                risk_tags.add("DUE_SOON")
+            elif due_week_mask[i]:
+                risk_factors.append("Due within a week")
+                risk_tags.add("DUE_THIS_WEEK")
+
+            if blocked[i]:
                 risk_factors.append("Currently blocked")
-            
-            # Check priority
-            if task.priority == TaskPriority.CRITICAL:
-                risk_score += 20
+                risk_tags.add("BLOCKED")
+
+            if critical[i]:
                 risk_factors.append("Critical priority")
-            
-            # Check dependencies
-            if task.dependencies:
-                deps = json.loads(task.dependencies) if isinstance(task.dependencies, str) else task.dependencies
-                if deps:
-                    risk_score += 10
-                    risk_factors.append(f"Has {len(deps)} dependencies")
-            
-            # Only report significant risks
-            if risk_score >= 30:
-                probability = min(risk_score / 100, 0.95)
-                
-                impact = "low"
-                if task.priority == TaskPriority.CRITICAL:
-                    impact = "high"
-                elif task.priority == TaskPriority.HIGH:
-                    impact = "medium"
-                
-                risks.append({
-                    "task_id": task.id,
-                    "task_name": task.name,
-                    "risk_probability": round(probability, 2),
-                    "impact": impact,
-                    "time_to_risk": f"{max(0, (task.deadline - datetime.utcnow()).days) if task.deadline else 'unknown'} days",
-                    "risk_factors": risk_factors,
-                    "suggested_action": self._suggest_risk_mitigation(risk_factors, probability)
-                })
-        
-        risks.sort(key=lambda x: x["risk_probability"], reverse=True)
+                risk_tags.add("CRITICAL")
+
+            if dep_count_arr[i]:
+                risk_factors.append(f"Has {dep_count_arr[i]} dependencies")
+
+            probability = min(int(scores[i]) / 100, 0.95)
+
+            impact = "low"
+            if critical[i]:
+                impact = "high"
+            elif prio_codes[i] == _HIGH_CODE:
+                impact = "medium"
+
+            risks.append({
+                "task_id": task.id,
+                "task_name": task.name,
+                "risk_probability": round(probability, 2),
+                "impact": impact,
+                "time_to_risk": f"{max(0, int(days[i])) if task.deadline else 'unknown'} days",
+                "risk_factors": risk_factors,
+                "suggested_action": self._suggest_risk_mitigation(risk_tags, probability)
+            })
         
         high_risk_count = sum(1 for r in risks if r["risk_probability"] > 0.6)
-        
+
+        # Partial sort: only the top 10 risks are returned, so avoid ordering
+        # the full list
+        top_risks = heapq.nlargest(10, risks, key=lambda x: x["risk_probability"])
+
         return {
             "data_available": True,
-            "analysis_timestamp": datetime.utcnow().isoformat(),
+            "analysis_timestamp": now.isoformat(),
             "total_risks_identified": len(risks),
             "high_risk_count": high_risk_count,
-            "risks": risks[:10],  # Top 10 risks
+            "risks": top_risks,
             "overall_risk_level": "high" if high_risk_count > 3 else ("medium" if high_risk_count > 0 else "low")
         }
     
-    def _suggest_risk_mitigation(self, factors: List[str], probability: float) -> str:
-        """Generate risk mitigation suggestion based on factors."""
-        if "Currently blocked" in str(factors):
+    def _suggest_risk_mitigation(self, tags: set, probability: float) -> str:
+        """Generate risk mitigation suggestion based on symbolic factor tags."""
+        if "BLOCKED" in tags:
             return "Prioritize unblocking - identify and address blocker immediately"
-        if "Overdue" in str(factors):
+        if "OVERDUE" in tags:
             return "Escalate and consider scope reduction or deadline extension"
         if probability > 0.7:
             return "High risk - consider adding resources or reprioritizing"
         return "Monitor closely and prepare contingency"
     
     # ==================== EXECUTIVE DASHBOARD ====================
-    
+
+    def _run_in_own_session(self, fn):
+        """Run fn on a fresh Session bound to the same engine.
+
+        Sessions are not thread-safe, so each thread-pool worker gets its
+        own short-lived session.
+        """
+        session = sessionmaker(bind=self.db.get_bind())()
+        try:
+            return fn(session)
+        finally:
+            session.close()
+
     def generate_executive_dashboard(self) -> Dict[str, Any]:
         """
         Generate executive dashboard with goal progress, risks, capacity, and decisions.
@@ -422,67 +606,106 @@ class AnalyticsAutomationAgent:
         Audience: Senior leadership
         Format: Concise, outcome-focused
         """
-        # Goal progress
-        goals = self.db.query(Goal).filter(Goal.status != GoalStatus.CANCELLED).all()
-        goal_summary = {
-            "total": len(goals),
-            "on_track": sum(1 for g in goals if g.status == GoalStatus.ON_TRACK),
-            "at_risk": sum(1 for g in goals if g.status == GoalStatus.AT_RISK),
-            "completed": sum(1 for g in goals if g.status == GoalStatus.COMPLETED)
-        }
-        
-        # Project health
-        project_analysis = self.analyze_project_performance()
-        projects_summary = {
-            "total": project_analysis.get("summary", {}).get("total_analyzed", 0) if "summary" in project_analysis else 1,
-            "average_health": project_analysis.get("summary", {}).get("average_health", project_analysis.get("health_score", 0)),
-            "declining": project_analysis.get("summary", {}).get("declining_count", 0) if "summary" in project_analysis else (1 if project_analysis.get("trend") == "declining" else 0)
-        }
-        
-        # Risk summary
-        risk_analysis = self.forecast_risks()
-        
-        # Capacity overview
-        workload_analysis = self.analyze_team_workload()
-        capacity_summary = {
-            "overloaded_count": len(workload_analysis.get("signals", {}).get("overloaded", [])),
-            "underutilized_count": len(workload_analysis.get("signals", {}).get("underutilized", [])),
-            "balanced_count": workload_analysis.get("signals", {}).get("balanced_count", 0)
-        }
+        def _goal_rollup(session: Session) -> GoalSummary:
+            goals = session.query(Goal).with_entities(Goal.status).filter(
+                Goal.status != GoalStatus.CANCELLED
+            ).all()
+            return GoalSummary(
+                total=len(goals),
+                on_track=sum(1 for g in goals if g.status == GoalStatus.ON_TRACK),
+                at_risk=sum(1 for g in goals if g.status == GoalStatus.AT_RISK),
+                completed=sum(1 for g in goals if g.status == GoalStatus.COMPLETED)
+            )
+
+        def _project_rollup(session: Session) -> Dict[str, Any]:
+            return AnalyticsAutomationAgent(session).analyze_project_performance()
+
+        def _open_task_rollups(session: Session) -> tuple:
+            # Fetch open tasks once and share them across the risk and
+            # capacity analyses instead of letting each issue its own task
+            # query. Only the columns those analyses read are loaded.
+            agent = AnalyticsAutomationAgent(session)
+            open_tasks = session.query(Task).options(
+                load_only(
+                    Task.id, Task.name, Task.status, Task.deadline,
+                    Task.priority, Task.estimated_hours, Task.owner, Task.project_id
+                )
+            ).filter(
+                Task.status.in_(_OPEN_STATUSES)
+            ).all()
+            return (
+                agent.forecast_risks(tasks=open_tasks),
+                agent.analyze_team_workload(tasks=open_tasks)
+            )
+
+        # The three rollups hit disjoint tables, so run them concurrently on
+        # their own sessions (Sessions are not thread-safe); wall-clock drops
+        # to roughly the slowest query instead of the sum.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            goal_future = pool.submit(self._run_in_own_session, _goal_rollup)
+            project_future = pool.submit(self._run_in_own_session, _project_rollup)
+            task_future = pool.submit(self._run_in_own_session, _open_task_rollups)
+
+            goal_summary = goal_future.result()
+            project_analysis = project_future.result()
+            risk_analysis, workload_analysis = task_future.result()
+
+        if "summary" in project_analysis:
+            projects_summary = ProjectSummary(
+                total=project_analysis["summary"]["total_analyzed"],
+                average_health=project_analysis["summary"]["average_health"],
+                declining=project_analysis["summary"]["declining_count"]
+            )
+        else:
+            projects_summary = ProjectSummary(
+                total=1,
+                average_health=project_analysis.get("health_score", 0),
+                declining=1 if project_analysis.get("trend") == "declining" else 0
+            )
+        
+        signals = workload_analysis.get("signals", {})
+        capacity_summary = CapacitySummary(
+            overloaded_count=len(signals.get("overloaded", [])),
+            underutilized_count=len(signals.get("underutilized", [])),
+            balanced_count=signals.get("balanced_count", 0)
+        )
         
+        risk_summary = RiskSummary(
+            level=risk_analysis.get("overall_risk_level", "unknown"),
+            high_risk_items=risk_analysis.get("high_risk_count", 0)
+        )
+
         return {
             "generated_at": datetime.utcnow().isoformat(),
             "audience": "senior_leadership",
             "summary": {
-                "goals": goal_summary,
-                "projects": projects_summary,
-                "risks": {
-                    "level": risk_analysis.get("overall_risk_level", "unknown"),
-                    "high_risk_items": risk_analysis.get("high_risk_count", 0)
-                },
-                "capacity": capacity_summary
+                "goals": goal_summary._asdict(),
+                "projects": projects_summary._asdict(),
+                "risks": risk_summary._asdict(),
+                "capacity": capacity_summary._asdict()
             },
-            "key_insights": self._generate_executive_insights(goal_summary, projects_summary, risk_analysis, capacity_summary),
+            "key_insights": self._generate_executive_insights(goal_summary, projects_summary, risk_summary, capacity_summary),
             "recommended_actions": workload_analysis.get("recommendations", [])[:3]
         }
     
-    def _generate_executive_insights(self, goals: Dict, projects: Dict, risks: Dict, capacity: Dict) -> List[str]:
+    def _generate_executive_insights(self, goals: GoalSummary, projects: ProjectSummary,
+                                     risks: RiskSummary, capacity: CapacitySummary) -> List[str]:
         """Generate key insights for executives."""
         insights = []
-        
-        if goals["at_risk"] > goals["on_track"]:
-            insights.append(f"⚠️ {goals['at_risk']} goals at risk vs {goals['on_track']} on track")
-        
-        if projects["average_health"] < 60:
-            insights.append(f"📉 Average project health at {projects['average_health']}% - below target")
-        elif projects["average_health"] > 80:
-            insights.append(f"✅ Strong project health at {projects['average_health']}%")
-        
-        if risks.get("high_risk_count", 0) > 3:
-            insights.append(f"🚨 {risks['high_risk_count']} high-risk items require attention")
-        
-        if capacity["overloaded_count"] > 0:
-            insights.append(f"👥 {capacity['overloaded_count']} team members overloaded")
+
+        if goals.at_risk > goals.on_track:
+            insights.append(f"⚠️ {goals.at_risk} goals at risk vs {goals.on_track} on track")
+
+        if projects.average_health < 60:
+            insights.append(f"📉 Average project health at {projects.average_health}% - below target")
+        elif projects.average_health > 80:
+            insights.append(f"✅ Strong project health at {projects.average_health}%")
+
+        if risks.high_risk_items > 3:
+            insights.append(f"🚨 {risks.high_risk_items} high-risk items require attention")
+
+        if capacity.overloaded_count > 0:
+            insights.append(f"👥 {capacity.overloaded_count} team members overloaded")
         
         if not insights:
             insights.append("✅ Operations running smoothly")
@@ -529,12 +752,14 @@ class AnalyticsAutomationAgent:
             })
         
         # Check goals
-        goals = self.db.query(Goal).filter(Goal.status == GoalStatus.AT_RISK).all()
-        if goals:
+        at_risk_goals = self.db.query(func.count()).select_from(Goal).filter(
+            Goal.status == GoalStatus.AT_RISK
+        ).scalar()
+        if at_risk_goals:
             suggestions.append({
                 "type": "goal_recovery",
                 "priority": "high",
-                "title": f"Review {len(goals)} at-risk goals",
+                "title": f"Review {at_risk_goals} at-risk goals",
                 "action": "Assess scope, resources, or timeline adjustments needed",
                 "rationale": "Goals marked at-risk need intervention",
                 "expected_impact": "Prevents goal failure and stakeholder disappointment",
@@ -604,57 +829,60 @@ class AnalyticsAutomationAgent:
         Prioritizes severity to avoid alert fatigue.
         """
         warnings = []
-        
+        now = datetime.utcnow()
+
         # Check for tasks due soon without progress
-        soon = datetime.utcnow() + timedelta(days=3)
-        at_risk_tasks = self.db.query(Task).filter(
-            Task.deadline <= soon,
-            Task.status == TaskStatus.NOT_STARTED
-        ).all()
-        
-        for task in at_risk_tasks[:5]:
+        soon = now + timedelta(days=3)
+        at_risk_tasks = self.db.query(Task).with_entities(
+            Task.id, Task.name, Task.deadline
+        ).filter(
+            Task.status == TaskStatus.NOT_STARTED,
+            Task.deadline <= soon
+        ).order_by(Task.deadline).limit(5).all()
+
+        for task in at_risk_tasks:
             warnings.append({
                 "severity": "high",
                 "type": "deadline_approaching",
                 "title": f"Task not started: {task.name}",
-                "cause": f"Due in {(task.deadline - datetime.utcnow()).days} days but not started",
+                "cause": f"Due in {(task.deadline - now).days} days but not started",
                 "suggested_action": "Start immediately or reassess deadline",
                 "task_id": task.id
             })
         
         # Check blocked tasks
-        blocked_tasks = self.db.query(Task).filter(Task.status == TaskStatus.BLOCKED).all()
-        blocked_critical = [t for t in blocked_tasks if t.priority == TaskPriority.CRITICAL]
-        
+        blocked_critical = self.db.query(func.count()).select_from(Task).filter(
+            Task.status == TaskStatus.BLOCKED,
+            Task.priority == TaskPriority.CRITICAL
+        ).scalar()
+
         if blocked_critical:
             warnings.append({
                 "severity": "critical",
                 "type": "critical_blocker",
-                "title": f"{len(blocked_critical)} critical task(s) blocked",
+                "title": f"{blocked_critical} critical task(s) blocked",
                 "cause": "Critical priority tasks unable to progress",
                 "suggested_action": "Identify and resolve blockers immediately"
             })
         
         # Check overdue milestones
-        overdue_milestones = self.db.query(Milestone).filter(
-            Milestone.due_date < datetime.utcnow(),
-            Milestone.status != "completed"
-        ).all()
-        
+        overdue_milestones = self.db.query(func.count()).select_from(Milestone).filter(
+            Milestone.target_date < now,
+            Milestone.is_completed.is_(False)
+        ).scalar()
+
         if overdue_milestones:
             warnings.append({
                 "severity": "high",
                 "type": "milestone_overdue",
-                "title": f"{len(overdue_milestones)} milestone(s) overdue",
+                "title": f"{overdue_milestones} milestone(s) overdue",
                 "cause": "Milestones past due date without completion",
                 "suggested_action": "Review milestone scope and update timeline"
             })
         
-        # Sort by severity
+        # Keep only the 10 most severe to prevent alert fatigue
         severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        warnings.sort(key=lambda x: severity_order.get(x["severity"], 4))
-        
-        return warnings[:10]  # Limit to prevent alert fatigue
+        return heapq.nsmallest(10, warnings, key=lambda x: severity_order.get(x["severity"], 4))
     
     # ==================== PATTERN LEARNING ====================
     
@@ -666,25 +894,31 @@ class AnalyticsAutomationAgent:
         Only claims learning when improvement is measurable.
         """
         # Analyze historical completed tasks
-        completed = self.db.query(Task).filter(
+        completed = self.db.query(Task).with_entities(
+            Task.estimated_hours, Task.actual_hours
+        ).filter(
             Task.status == TaskStatus.COMPLETED
         ).order_by(Task.updated_at.desc()).limit(100).all()
-        
+
         if len(completed) < 20:
             return {
                 "patterns_detected": False,
                 "confidence": "insufficient_data",
                 "message": "Need more historical data for pattern analysis"
             }
-        
-        # Analyze estimation accuracy
-        estimation_errors = []
-        for task in completed:
-            if task.estimated_hours and task.actual_hours:
-                error = abs(task.actual_hours - task.estimated_hours) / task.estimated_hours
-                estimation_errors.append(error)
-        
-        avg_estimation_error = sum(estimation_errors) / len(estimation_errors) if estimation_errors else None
+
+        # Analyze estimation accuracy as one vectorized kernel over the
+        # estimated/actual hour columns
+        estimated = np.array([t.estimated_hours or 0 for t in completed], dtype=np.float64)
+        actual = np.array([t.actual_hours or 0 for t in completed], dtype=np.float64)
+        measured = (estimated > 0) & (actual > 0)
+
+        if measured.any():
+            avg_estimation_error = float(
+                np.mean(np.abs(actual[measured] - estimated[measured]) / estimated[measured])
+            )
+        else:
+            avg_estimation_error = None
         
         # Analyze common blockers (from notes/tags if available)
         patterns = {
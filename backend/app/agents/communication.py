@@ -10,17 +10,269 @@ Implements:
 
 import os
 import json
-from typing import List, Dict, Any, Optional
+import time
+import uuid
+import random
+import asyncio
+import hashlib
+import functools
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from datetime import datetime, timedelta
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, RateLimitError, APIConnectionError, APIStatusError
+from backend.app.agents._http import get_sync_client, get_async_client
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Upper bound on in-flight LLM requests when batching with generate_many,
+# so large batches don't trip API rate limits.
+MAX_CONCURRENT_LLM_CALLS = 32
+
+# How many standups to pack into a single completion request; keeps the
+# combined prompt comfortably under the context/TPM budget.
+TEAM_STANDUP_MAX_PER_CALL = 20
+
+# Standups, reminders and status updates are built from short structured
+# fields, so repeat calls often produce byte-identical prompts. Cache
+# those responses and skip the API round trip entirely.
+LLM_CACHE_MAX_ENTRIES = 10_000
+
+# OpenAI account limits; generate_many batches are throttled to stay
+# under both so bursts don't trip 429s in the first place.
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "500"))
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "450000"))
+
+MAX_LLM_RETRIES = 6
+
+
+def _estimate_tokens(text: str) -> int:
+    # ~4 chars per token for English text; close enough to meter a
+    # bucket without pulling in a tokenizer dependency
+    return max(1, len(text) // 4)
+
+
+def _backoff_seconds(attempt: int) -> float:
+    return min(60.0, 2 ** attempt + random.random())
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, (RateLimitError, APIConnectionError)):
+        return True
+    return isinstance(exc, APIStatusError) and exc.status_code >= 500
+
+
+class _RateLimiter:
+    """
+    Dual token bucket over requests/min and tokens/min, refilled lazily
+    from elapsed time. Concurrent callers acquire before each API call
+    and sleep just long enough for the bucket to cover them.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60.0)
+        self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60.0)
+
+    async def acquire(self, tokens: int) -> None:
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._requests >= 1.0 and self._tokens >= tokens:
+                    self._requests -= 1.0
+                    self._tokens -= tokens
+                    return
+                wait = max(
+                    (1.0 - self._requests) * 60.0 / self.rpm,
+                    (tokens - self._tokens) * 60.0 / self.tpm
+                )
+            await asyncio.sleep(max(wait, 0.05))
+
+
+_rate_limiter = _RateLimiter(OPENAI_RPM, OPENAI_TPM)
+
+
+if orjson is not None:
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 if indent else 0
+        ).decode()
+else:
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        if indent:
+            return json.dumps(obj, indent=2)
+        return json.dumps(obj, separators=(",", ":"))
+
+
+if orjson is not None:
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+else:
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=4096)
+def _dumps_items(items: Tuple[str, ...]) -> str:
+    """Serialize a list of short strings, memoized; standup/reminder
+    fields repeat across calls so the same list serializes once."""
+    return _json_dumps(list(items))
+
+
+# Static instruction and schema blocks per generation kind. They are sent
+# in the system message so every variable field lands after a fixed
+# prefix, letting OpenAI's prompt-prefix cache discount the repeated
+# tokens and cut time-to-first-token on repeat calls.
+
+_STANDUP_INSTRUCTIONS = """
+    Task: Generate a daily standup summary for the user described in the message.
+
+    Return JSON with:
+    {
+        "summary": "Brief overall summary",
+        "formatted_message": "Full formatted standup message",
+        "action_items": ["List of action items derived from blockers"],
+        "needs_follow_up": boolean
+    }
+    """
+
+_TEAM_STANDUP_INSTRUCTIONS = """
+    Task: Generate daily standup summaries for every team member in the message.
+
+    Return a JSON object keyed by each user's name, where each value is:
+    {
+        "summary": "Brief overall summary",
+        "formatted_message": "Full formatted standup message",
+        "action_items": ["List of action items derived from blockers"],
+        "needs_follow_up": boolean
+    }
+    """
+
+_PROGRESS_REPORT_INSTRUCTIONS = """
+    Task: Generate a progress report for the report type and audience in the message.
+
+    Audience guidance:
+    - executive: Focus on outcomes, risks, and high-level status. Be concise.
+    - team: Include technical details and specific task updates.
+    - stakeholder: Focus on milestone progress and timeline adherence.
+
+    Return JSON with:
+    {
+        "title": "Report title",
+        "executive_summary": "2-3 sentence summary",
+        "key_metrics": {
+            "completed": number,
+            "in_progress": number,
+            "blocked": number,
+            "completion_rate": "percentage"
+        },
+        "highlights": ["Key achievements"],
+        "risks": ["Current risks and mitigations"],
+        "next_steps": ["What's coming next"],
+        "full_report": "Full formatted report text"
+    }
+    """
+
+_REMINDER_INSTRUCTIONS = """
+    Task: Generate a reminder message in the tone given in the message.
+
+    Requirements:
+    - Be respectful and professional
+    - Provide context, not just demand
+    - Avoid blame language
+    - Include specific action needed
+
+    Return JSON with:
+    {
+        "subject": "Email subject line",
+        "greeting": "Appropriate greeting",
+        "message": "Main message body",
+        "call_to_action": "What you need them to do",
+        "closing": "Professional closing",
+        "full_message": "Complete formatted message"
+    }
+    """
+
+_MEETING_SUMMARY_INSTRUCTIONS = """
+    Task: Summarize the meeting transcript in the message.
+
+    Return JSON with:
+    {
+        "summary": "2-3 sentence summary",
+        "key_topics": ["Topics discussed"],
+        "decisions_made": [
+            {
+                "decision": "What was decided",
+                "rationale": "Why",
+                "owner": "Who's responsible"
+            }
+        ],
+        "action_items": [
+            {
+                "task": "What needs to be done",
+                "owner": "Who",
+                "due_date": "When if mentioned"
+            }
+        ],
+        "unresolved_questions": ["Questions that weren't answered"],
+        "follow_ups_needed": ["Things that need follow-up"]
+    }
+    """
+
+_STATUS_UPDATE_INSTRUCTIONS = """
+    Task: Generate a status update for the audience in the message.
+
+    Return JSON with:
+    {
+        "headline": "One-line status",
+        "details": "Detailed update",
+        "next_actions": ["What happens next"],
+        "needs_input": boolean,
+        "formatted_update": "Full formatted update"
+    }
+    """
+
+_ESCALATION_INSTRUCTIONS = """
+    Task: Generate an escalation message.
+
+    Requirements:
+    - Be clear about the urgency
+    - Provide context
+    - Present the suggested solution
+    - Request specific action
+
+    Return JSON with:
+    {
+        "subject": "Urgent but professional subject",
+        "message": "Clear, professional escalation message",
+        "urgency_level": "high|medium",
+        "action_requested": "Specific ask"
+    }
+    """
 
 
 class CommunicationAgent:
     """
     Communication Agent for generating various types of communications.
     Uses LLM for natural language generation.
+
+    Single generations go through the synchronous generate_* methods;
+    batches of independent generations should use generate_many, which
+    fires the requests concurrently and overlaps the network round trips.
     """
-    
+
     SYSTEM_PROMPT = """
     You are a professional communication assistant for project management.
     Your role is to:
@@ -28,29 +280,490 @@ class CommunicationAgent:
     2. Adapt tone based on audience (executives, team, individuals)
     3. Focus on actionable information
     4. Be respectful and supportive, never blame-oriented
-    
+
     Always structure output in a clear, scannable format.
     """
-    
+
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key) if self.api_key else None
+        # Process-wide pooled clients (shared with the other agents via
+        # _http) so a fresh CommunicationAgent never means a fresh HTTPX
+        # pool and TLS handshake.
+        self.client = get_sync_client()
+        self.async_client = get_async_client()
         self.model = "gpt-4o"
-    
+        # With no API key, generators fall back to deterministic
+        # template rendering instead of raising
+        self.offline = self.client is None
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+
+    def _cache_key(self, prompt: str, system: str) -> str:
+        return hashlib.blake2b(
+            f"{self.model}\x00{system}\x00{prompt}".encode()
+        ).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key: str, content: str) -> None:
+        self._response_cache[key] = content
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > LLM_CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
+
     def _query_llm(self, prompt: str, system_override: Optional[str] = None) -> str:
         if not self.client:
             raise ValueError("OpenAI API key not configured")
-        
-        response = self.client.chat.completions.create(
+
+        key = self._cache_key(prompt, system_override or self.SYSTEM_PROMPT)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        for attempt in range(MAX_LLM_RETRIES + 1):
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_override or self.SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    response_format={"type": "json_object"}
+                )
+                break
+            except Exception as e:
+                if attempt >= MAX_LLM_RETRIES or not _is_retryable(e):
+                    raise
+                time.sleep(_backoff_seconds(attempt))
+        content = response.choices[0].message.content
+        self._cache_put(key, content)
+        return content
+
+    async def _query_llm_async(self, prompt: str, system_override: Optional[str] = None) -> str:
+        if not self.async_client:
+            raise ValueError("OpenAI API key not configured")
+
+        key = self._cache_key(prompt, system_override or self.SYSTEM_PROMPT)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        system = system_override or self.SYSTEM_PROMPT
+        for attempt in range(MAX_LLM_RETRIES + 1):
+            await _rate_limiter.acquire(_estimate_tokens(system + prompt))
+            try:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system},
+                        {"role": "user", "content": prompt}
+                    ],
+                    response_format={"type": "json_object"}
+                )
+                break
+            except Exception as e:
+                if attempt >= MAX_LLM_RETRIES or not _is_retryable(e):
+                    raise
+                await asyncio.sleep(_backoff_seconds(attempt))
+        content = response.choices[0].message.content
+        self._cache_put(key, content)
+        return content
+
+    async def _query_llm_stream(
+        self,
+        prompt: str,
+        system_override: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion as content deltas instead of waiting for the
+        full body, so long outputs (full_report, full_message) can be
+        forwarded to the UI token by token. Callers that need the parsed
+        JSON accumulate the chunks and json.loads once at the end.
+
+        Cached prompts yield their full response as a single chunk.
+        """
+        if not self.async_client:
+            raise ValueError("OpenAI API key not configured")
+
+        key = self._cache_key(prompt, system_override or self.SYSTEM_PROMPT)
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        await _rate_limiter.acquire(_estimate_tokens((system_override or self.SYSTEM_PROMPT) + prompt))
+        response = await self.async_client.chat.completions.create(
             model=self.model,
             messages=[
                 {"role": "system", "content": system_override or self.SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"}
+            response_format={"type": "json_object"},
+            stream=True
+        )
+        parts = []
+        async for chunk in response:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                yield delta
+        self._cache_put(key, "".join(parts))
+
+    async def generate_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Run several independent generations concurrently.
+
+        Args:
+            calls: List of (kind, kwargs) pairs where kind is one of
+                "standup", "progress_report", "reminder", "meeting_summary",
+                "status_update", "escalation" and kwargs matches the
+                corresponding generate_* signature.
+
+        Returns:
+            Results aligned with the input order; failed generations are
+            returned as their exception instead of raising.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+
+        async def run_one(kind: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            if self.offline:
+                return self._OFFLINE_BUILDERS[kind](self, **kwargs)
+            system, user_msg = self._PROMPT_BUILDERS[kind](self, **kwargs)
+            async with semaphore:
+                result = await self._query_llm_async(user_msg, system_override=system)
+            return _json_loads(result)
+
+        return await asyncio.gather(
+            *(run_one(kind, kwargs) for kind, kwargs in calls),
+            return_exceptions=True
+        )
+
+    def submit_batch(self, jobs: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Submit generations to the OpenAI Batch API (50% cheaper, up to 24h).
+
+        Meant for non-interactive workloads like nightly progress reports
+        and post-meeting summaries where minutes of latency is fine.
+
+        Args:
+            jobs: Same (kind, kwargs) pairs as generate_many.
+
+        Returns:
+            {"batch_id": str, "custom_ids": [str]} with custom_ids aligned
+            to the input order, for matching results from poll_batch.
+        """
+        if not self.client:
+            raise ValueError("OpenAI API key not configured")
+
+        custom_ids = []
+        lines = []
+        for kind, kwargs in jobs:
+            system, user_msg = self._PROMPT_BUILDERS[kind](self, **kwargs)
+            custom_id = str(uuid.uuid4())
+            custom_ids.append(custom_id)
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": system},
+                        {"role": "user", "content": user_msg}
+                    ],
+                    "response_format": {"type": "json_object"}
+                }
+            }))
+
+        input_file = self.client.files.create(
+            file=("communication_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
         )
-        return response.choices[0].message.content
-    
+        return {"batch_id": batch.id, "custom_ids": custom_ids}
+
+    def poll_batch(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Check a submitted batch and collect its results when done.
+
+        Args:
+            batch_id: Id returned by submit_batch
+
+        Returns:
+            {"status": str, "results": {custom_id: parsed_json} | None};
+            results is populated only once status is "completed".
+        """
+        if not self.client:
+            raise ValueError("OpenAI API key not configured")
+
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            return {"status": batch.status, "results": None}
+
+        raw = self.client.files.content(batch.output_file_id).text
+        results = {}
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            row = _json_loads(line)
+            content = row["response"]["body"]["choices"][0]["message"]["content"]
+            results[row["custom_id"]] = _json_loads(content)
+        return {"status": "completed", "results": results}
+
+    # ==================== PROMPT BUILDERS ====================
+
+    def _standup_prompt(
+        self,
+        user: str,
+        completed: List[str],
+        planned: List[str],
+        blockers: List[str]
+    ) -> Tuple[str, str]:
+        return self.SYSTEM_PROMPT + _STANDUP_INSTRUCTIONS, f"""
+        User: {user}
+
+        Yesterday's Completed Work:
+        {_dumps_items(tuple(completed))}
+
+        Today's Planned Work:
+        {_dumps_items(tuple(planned))}
+
+        Current Blockers:
+        {_dumps_items(tuple(blockers))}
+        """
+
+    def _team_standup_prompt(self, items: List[Dict[str, Any]]) -> Tuple[str, str]:
+        payload = [
+            {
+                "user": item["user"],
+                "completed": item.get("completed", []),
+                "planned": item.get("planned", []),
+                "blockers": item.get("blockers", [])
+            }
+            for item in items
+        ]
+        return self.SYSTEM_PROMPT + _TEAM_STANDUP_INSTRUCTIONS, f"""
+        Team Data ({len(items)} members):
+        {_json_dumps(payload)}
+        """
+
+    def _progress_report_prompt(
+        self,
+        report_type: str,
+        audience: str,
+        project_data: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        return self.SYSTEM_PROMPT + _PROGRESS_REPORT_INSTRUCTIONS, f"""
+        Report Type: {report_type}
+        Audience: {audience}
+
+        Project Data:
+        {_json_dumps(project_data, indent=True)}
+        """
+
+    def _reminder_prompt(
+        self,
+        recipient: str,
+        topic: str,
+        context: str,
+        deadline: Optional[datetime] = None,
+        tone: str = "friendly"
+    ) -> Tuple[str, str]:
+        deadline_text = f"Deadline: {deadline.strftime('%B %d, %Y')}" if deadline else ""
+
+        return self.SYSTEM_PROMPT + _REMINDER_INSTRUCTIONS, f"""
+        Tone: {tone}
+        Recipient: {recipient}
+        Topic: {topic}
+        Context: {context}
+        {deadline_text}
+        """
+
+    def _meeting_summary_prompt(
+        self,
+        transcript: str,
+        meeting_type: str = "general"
+    ) -> Tuple[str, str]:
+        return self.SYSTEM_PROMPT + _MEETING_SUMMARY_INSTRUCTIONS, f"""
+        Meeting Type: {meeting_type}
+
+        Transcript:
+        {transcript}
+        """
+
+    def _status_update_prompt(
+        self,
+        task_name: str,
+        status: str,
+        progress_notes: str,
+        audience: str = "team"
+    ) -> Tuple[str, str]:
+        return self.SYSTEM_PROMPT + _STATUS_UPDATE_INSTRUCTIONS, f"""
+        Audience: {audience}
+        Task: {task_name}
+        Status: {status}
+        Progress Notes: {progress_notes}
+        """
+
+    def _escalation_prompt(
+        self,
+        task_name: str,
+        issue: str,
+        suggested_action: str,
+        recipient: str
+    ) -> Tuple[str, str]:
+        return self.SYSTEM_PROMPT + _ESCALATION_INSTRUCTIONS, f"""
+        Recipient: {recipient}
+        Task: {task_name}
+        Issue: {issue}
+        Suggested Action: {suggested_action}
+        """
+
+    _PROMPT_BUILDERS = {
+        "standup": _standup_prompt,
+        "progress_report": _progress_report_prompt,
+        "reminder": _reminder_prompt,
+        "meeting_summary": _meeting_summary_prompt,
+        "status_update": _status_update_prompt,
+        "escalation": _escalation_prompt,
+    }
+
+    # ==================== OFFLINE RENDERERS ====================
+    # Deterministic, schema-compatible fallbacks used when no OpenAI key
+    # is configured, keeping dev loops and CI fully off the network.
+
+    def _offline_standup(
+        self,
+        user: str,
+        completed: List[str],
+        planned: List[str],
+        blockers: List[str]
+    ) -> Dict[str, Any]:
+        lines = [f"Standup for {user}"]
+        if completed:
+            lines.append("Done: " + "; ".join(completed))
+        if planned:
+            lines.append("Planned: " + "; ".join(planned))
+        if blockers:
+            lines.append("Blockers: " + "; ".join(blockers))
+        return {
+            "summary": (
+                f"{user}: {len(completed)} completed, "
+                f"{len(planned)} planned, {len(blockers)} blockers"
+            ),
+            "formatted_message": "\n".join(lines),
+            "action_items": [f"Resolve blocker: {b}" for b in blockers],
+            "needs_follow_up": bool(blockers)
+        }
+
+    def _offline_progress_report(
+        self,
+        report_type: str,
+        audience: str,
+        project_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            "title": f"{report_type.capitalize()} Progress Report",
+            "executive_summary": f"{report_type.capitalize()} report for {audience}.",
+            "key_metrics": {
+                "completed": project_data.get("completed", 0),
+                "in_progress": project_data.get("in_progress", 0),
+                "blocked": project_data.get("blocked", 0),
+                "completion_rate": project_data.get("completion_rate", "n/a")
+            },
+            "highlights": project_data.get("highlights", []),
+            "risks": project_data.get("risks", []),
+            "next_steps": project_data.get("next_steps", []),
+            "full_report": _json_dumps(project_data, indent=True)
+        }
+
+    def _offline_reminder(
+        self,
+        recipient: str,
+        topic: str,
+        context: str,
+        deadline: Optional[datetime] = None,
+        tone: str = "friendly"
+    ) -> Dict[str, Any]:
+        deadline_text = f" by {deadline.strftime('%B %d, %Y')}" if deadline else ""
+        message = f"This is a {tone} reminder about {topic}{deadline_text}. {context}".strip()
+        return {
+            "subject": f"Reminder: {topic}",
+            "greeting": f"Hi {recipient},",
+            "message": message,
+            "call_to_action": f"Please follow up on {topic}{deadline_text}.",
+            "closing": "Thank you!",
+            "full_message": f"Hi {recipient},\n\n{message}\n\nThank you!"
+        }
+
+    def _offline_meeting_summary(
+        self,
+        transcript: str,
+        meeting_type: str = "general"
+    ) -> Dict[str, Any]:
+        return {
+            "summary": (
+                f"{meeting_type.capitalize()} meeting transcript of "
+                f"{len(transcript.split())} words (LLM summary unavailable offline)."
+            ),
+            "key_topics": [],
+            "decisions_made": [],
+            "action_items": [],
+            "unresolved_questions": [],
+            "follow_ups_needed": []
+        }
+
+    def _offline_status_update(
+        self,
+        task_name: str,
+        status: str,
+        progress_notes: str,
+        audience: str = "team"
+    ) -> Dict[str, Any]:
+        headline = f"{task_name}: {status}"
+        return {
+            "headline": headline,
+            "details": progress_notes,
+            "next_actions": [],
+            "needs_input": False,
+            "formatted_update": f"[{audience}] {headline} - {progress_notes}"
+        }
+
+    def _offline_escalation(
+        self,
+        task_name: str,
+        issue: str,
+        suggested_action: str,
+        recipient: str
+    ) -> Dict[str, Any]:
+        return {
+            "subject": f"Escalation: {task_name}",
+            "message": (
+                f"Escalating '{task_name}' to {recipient}: {issue}. "
+                f"Suggested action: {suggested_action}."
+            ),
+            "urgency_level": "high",
+            "action_requested": suggested_action
+        }
+
+    _OFFLINE_BUILDERS = {
+        "standup": _offline_standup,
+        "progress_report": _offline_progress_report,
+        "reminder": _offline_reminder,
+        "meeting_summary": _offline_meeting_summary,
+        "status_update": _offline_status_update,
+        "escalation": _offline_escalation,
+    }
+
+    # ==================== GENERATORS ====================
+
     def generate_standup(
         self,
         user: str,
@@ -60,40 +773,63 @@ class CommunicationAgent:
     ) -> Dict[str, Any]:
         """
         Generate a daily standup summary.
-        
+
         Args:
             user: Who the standup is for
             completed: What was completed yesterday
             planned: What's planned for today
             blockers: Any blockers
-        
+
         Returns:
             Formatted standup message
         """
-        prompt = f"""
-        Generate a daily standup summary for {user}.
-        
-        Yesterday's Completed Work:
-        {json.dumps(completed)}
-        
-        Today's Planned Work:
-        {json.dumps(planned)}
-        
-        Current Blockers:
-        {json.dumps(blockers)}
-        
-        Return JSON with:
-        {{
-            "summary": "Brief overall summary",
-            "formatted_message": "Full formatted standup message",
-            "action_items": ["List of action items derived from blockers"],
-            "needs_follow_up": boolean
-        }}
+        if self.offline:
+            return self._offline_standup(user, completed, planned, blockers)
+
+        system, user_msg = self._standup_prompt(user, completed, planned, blockers)
+        result = self._query_llm(user_msg, system_override=system)
+        return _json_loads(result)
+
+    async def generate_team_standups(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """
-        
-        result = self._query_llm(prompt)
-        return json.loads(result)
-    
+        Generate standups for a whole team, packed K-per-request.
+
+        One completion covers up to TEAM_STANDUP_MAX_PER_CALL users, so a
+        scheduled team standup costs 1-2 requests instead of one per user
+        and pays the shared system prompt once per pack.
+
+        Args:
+            items: One dict per user with "user", "completed", "planned"
+                and "blockers" keys (same fields as generate_standup)
+
+        Returns:
+            Standups aligned with the input order
+        """
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(items), TEAM_STANDUP_MAX_PER_CALL):
+            pack = items[start:start + TEAM_STANDUP_MAX_PER_CALL]
+            try:
+                system, user_msg = self._team_standup_prompt(pack)
+                parsed = _json_loads(
+                    await self._query_llm_async(user_msg, system_override=system)
+                )
+                results.extend(parsed[item["user"]] for item in pack)
+            except (KeyError, TypeError, ValueError):
+                # Malformed packed response: fall back to per-user calls
+                results.extend(await self.generate_many([
+                    ("standup", {
+                        "user": item["user"],
+                        "completed": item.get("completed", []),
+                        "planned": item.get("planned", []),
+                        "blockers": item.get("blockers", [])
+                    })
+                    for item in pack
+                ]))
+        return results
+
     def generate_progress_report(
         self,
         report_type: str,  # daily, weekly, monthly
@@ -102,49 +838,22 @@ class CommunicationAgent:
     ) -> Dict[str, Any]:
         """
         Generate a progress report.
-        
+
         Args:
             report_type: Type of report
             audience: Target audience
             project_data: Data to include in report
-        
+
         Returns:
             Formatted report
         """
-        audience_guidance = {
-            "executive": "Focus on outcomes, risks, and high-level status. Be concise.",
-            "team": "Include technical details and specific task updates.",
-            "stakeholder": "Focus on milestone progress and timeline adherence."
-        }
-        
-        prompt = f"""
-        Generate a {report_type} progress report for {audience} audience.
-        
-        Guidance: {audience_guidance.get(audience, '')}
-        
-        Project Data:
-        {json.dumps(project_data, indent=2)}
-        
-        Return JSON with:
-        {{
-            "title": "Report title",
-            "executive_summary": "2-3 sentence summary",
-            "key_metrics": {{
-                "completed": number,
-                "in_progress": number,
-                "blocked": number,
-                "completion_rate": "percentage"
-            }},
-            "highlights": ["Key achievements"],
-            "risks": ["Current risks and mitigations"],
-            "next_steps": ["What's coming next"],
-            "full_report": "Full formatted report text"
-        }}
-        """
-        
-        result = self._query_llm(prompt)
-        return json.loads(result)
-    
+        if self.offline:
+            return self._offline_progress_report(report_type, audience, project_data)
+
+        system, user_msg = self._progress_report_prompt(report_type, audience, project_data)
+        result = self._query_llm(user_msg, system_override=system)
+        return _json_loads(result)
+
     def generate_reminder(
         self,
         recipient: str,
@@ -155,47 +864,24 @@ class CommunicationAgent:
     ) -> Dict[str, Any]:
         """
         Generate a polite reminder message.
-        
+
         Args:
             recipient: Who to remind
             topic: What the reminder is about
             context: Additional context
             deadline: Optional deadline
             tone: Tone of the message
-        
+
         Returns:
             Reminder message
         """
-        deadline_text = f"Deadline: {deadline.strftime('%B %d, %Y')}" if deadline else ""
-        
-        prompt = f"""
-        Generate a {tone} reminder message.
-        
-        Recipient: {recipient}
-        Topic: {topic}
-        Context: {context}
-        {deadline_text}
-        
-        Requirements:
-        - Be respectful and professional
-        - Provide context, not just demand
-        - Avoid blame language
-        - Include specific action needed
-        
-        Return JSON with:
-        {{
-            "subject": "Email subject line",
-            "greeting": "Appropriate greeting",
-            "message": "Main message body",
-            "call_to_action": "What you need them to do",
-            "closing": "Professional closing",
-            "full_message": "Complete formatted message"
-        }}
-        """
-        
-        result = self._query_llm(prompt)
-        return json.loads(result)
-    
+        if self.offline:
+            return self._offline_reminder(recipient, topic, context, deadline, tone)
+
+        system, user_msg = self._reminder_prompt(recipient, topic, context, deadline, tone)
+        result = self._query_llm(user_msg, system_override=system)
+        return _json_loads(result)
+
     def summarize_meeting(
         self,
         transcript: str,
@@ -203,46 +889,21 @@ class CommunicationAgent:
     ) -> Dict[str, Any]:
         """
         Summarize a meeting transcript.
-        
+
         Args:
             transcript: Meeting transcript
             meeting_type: Type of meeting
-        
+
         Returns:
             Meeting summary with decisions and action items
         """
-        prompt = f"""
-        Summarize this {meeting_type} meeting transcript.
-        
-        Transcript:
-        {transcript}
-        
-        Return JSON with:
-        {{
-            "summary": "2-3 sentence summary",
-            "key_topics": ["Topics discussed"],
-            "decisions_made": [
-                {{
-                    "decision": "What was decided",
-                    "rationale": "Why",
-                    "owner": "Who's responsible"
-                }}
-            ],
-            "action_items": [
-                {{
-                    "task": "What needs to be done",
-                    "owner": "Who",
-                    "due_date": "When if mentioned"
-                }}
-            ],
-            "unresolved_questions": ["Questions that weren't answered"],
-            "follow_ups_needed": ["Things that need follow-up"]
-        }}
-        """
-        
-        result = self._query_llm(prompt)
-        return json.loads(result)
-    
+        if self.offline:
+            return self._offline_meeting_summary(transcript, meeting_type)
+
+        system, user_msg = self._meeting_summary_prompt(transcript, meeting_type)
+        result = self._query_llm(user_msg, system_override=system)
+        return _json_loads(result)
+
     def generate_status_update(
         self,
         task_name: str,
@@ -252,36 +913,23 @@ class CommunicationAgent:
     ) -> Dict[str, Any]:
         """
         Generate a status update message.
-        
+
         Args:
             task_name: Name of the task
             status: Current status
             progress_notes: What's been done
             audience: Who the update is for
-        
+
         Returns:
             Formatted status update
         """
-        prompt = f"""
-        Generate a status update for {audience}.
-        
-        Task: {task_name}
-        Status: {status}
-        Progress Notes: {progress_notes}
-        
-        Return JSON with:
-        {{
-            "headline": "One-line status",
-            "details": "Detailed update",
-            "next_actions": ["What happens next"],
-            "needs_input": boolean,
-            "formatted_update": "Full formatted update"
-        }}
-        """
-        
-        result = self._query_llm(prompt)
-        return json.loads(result)
-    
+        if self.offline:
+            return self._offline_status_update(task_name, status, progress_notes, audience)
+
+        system, user_msg = self._status_update_prompt(task_name, status, progress_notes, audience)
+        result = self._query_llm(user_msg, system_override=system)
+        return _json_loads(result)
+
     def generate_escalation_message(
         self,
         task_name: str,
@@ -291,41 +939,22 @@ class CommunicationAgent:
     ) -> Dict[str, Any]:
         """
         Generate an escalation message.
-        
+
         Args:
             task_name: Task with issue
             issue: What the problem is
             suggested_action: Recommended action
             recipient: Who to escalate to
-        
+
         Returns:
             Escalation message
         """
-        prompt = f"""
-        Generate an escalation message.
-        
-        Recipient: {recipient}
-        Task: {task_name}
-        Issue: {issue}
-        Suggested Action: {suggested_action}
-        
-        Requirements:
-        - Be clear about the urgency
-        - Provide context
-        - Present the suggested solution
-        - Request specific action
-        
-        Return JSON with:
-        {{
-            "subject": "Urgent but professional subject",
-            "message": "Clear, professional escalation message",
-            "urgency_level": "high|medium",
-            "action_requested": "Specific ask"
-        }}
-        """
-        
-        result = self._query_llm(prompt)
-        return json.loads(result)
+        if self.offline:
+            return self._offline_escalation(task_name, issue, suggested_action, recipient)
+
+        system, user_msg = self._escalation_prompt(task_name, issue, suggested_action, recipient)
+        result = self._query_llm(user_msg, system_override=system)
+        return _json_loads(result)
 
 
 # Singleton instance
@@ -9,11 +9,13 @@ Implements:
 
 import os
 import json
+from itertools import groupby
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from sqlalchemy import func, case
 from sqlalchemy.orm import Session
 from backend.app.models import (
-    Task, TaskStatus, TaskHistory, AgentActivity, Escalation
+    Task, TaskStatus, TaskHistory, AgentActivity, Escalation, TaskDependency
 )
 import uuid
 
@@ -28,26 +30,35 @@ class ExecutionAgent:
         self.db = db
         self.stale_threshold_hours = 48
         self.blocked_threshold_hours = 24
+        # How many per-task interventions were merged into owner-level
+        # ones; lets us track the notification reduction rate
+        self.interventions_coalesced = 0
+        # Decision log rows held back for a single commit (batch mode)
+        self._pending_activities: List[AgentActivity] = []
     
     def process_task_update(
         self,
         task_id: str,
-        update: Dict[str, Any]
+        update: Dict[str, Any],
+        batch: bool = False
     ) -> Dict[str, Any]:
         """
         Process a task status update and determine follow-up actions.
-        
+
         Args:
             task_id: Task being updated
             update: Update details (status, progress, blockers)
-        
+            batch: When processing many updates, defer the decision-log
+                commit and call flush_activities() once at the end
+
         Returns:
             Processing result with any triggered actions
         """
         task = self.db.query(Task).filter(Task.id == task_id).first()
         if not task:
             raise ValueError(f"Task {task_id} not found")
-        
+
+        now = datetime.utcnow()
         actions_triggered = []
         notifications = []
         
@@ -58,7 +69,7 @@ class ExecutionAgent:
             
             if new_status == "completed":
                 # Check downstream tasks
-                downstream = self.check_downstream_impact(task_id)
+                downstream = self.check_downstream_impact(task_id, task=task)
                 if downstream["unblocked_tasks"]:
                     actions_triggered.append({
                         "type": "unblock",
@@ -77,66 +88,84 @@ class ExecutionAgent:
                     })
         
         # Check for overdue
-        if task.deadline and task.deadline < datetime.utcnow():
+        if task.deadline and task.deadline < now:
             if task.status not in [TaskStatus.COMPLETED, TaskStatus.CANCELLED]:
                 actions_triggered.append({
                     "type": "overdue_warning",
                     "task_id": task_id,
-                    "days_overdue": (datetime.utcnow() - task.deadline).days
+                    "days_overdue": (now - task.deadline).days
                 })
         
         # Log the processing
         self._log_execution_decision(
             task_id=task_id,
             decision=f"Processed update: {json.dumps(update)}",
-            actions=actions_triggered
+            actions=actions_triggered,
+            batch=batch
         )
         
         return {
             "task_id": task_id,
-            "processed_at": datetime.utcnow().isoformat(),
+            "processed_at": now.isoformat(),
             "actions_triggered": actions_triggered,
             "notifications": notifications
         }
     
-    def check_downstream_impact(self, task_id: str) -> Dict[str, Any]:
+    def check_downstream_impact(
+        self,
+        task_id: str,
+        task: Optional[Task] = None
+    ) -> Dict[str, Any]:
         """
         Analyze impact on tasks that depend on this task.
-        
+
         Args:
             task_id: The task that was updated
-        
+            task: The already-loaded Task, when the caller has it, to
+                skip re-fetching the same row
+
         Returns:
             Impact analysis with affected tasks
         """
-        task = self.db.query(Task).filter(Task.id == task_id).first()
+        if task is None:
+            task = self.db.query(Task).filter(Task.id == task_id).first()
         if not task:
             raise ValueError(f"Task {task_id} not found")
         
-        # Find tasks that depend on this one
-        from backend.app.models import TaskDependency
-        
-        dependent_tasks = self.db.query(Task).join(
+        # Find tasks that depend on this one; column rows skip full ORM
+        # hydration since this path only reads and never mutates them
+        dependent_tasks = self.db.query(
+            Task.id, Task.name, Task.owner, Task.status
+        ).join(
             TaskDependency,
             TaskDependency.task_id == Task.id
         ).filter(
             TaskDependency.depends_on_id == task_id
         ).all()
-        
+
+        # Count each dependent's incomplete dependencies in one grouped
+        # join instead of one query per dependency row
+        pending_deps = {}
+        if dependent_tasks:
+            rows = self.db.query(
+                TaskDependency.task_id,
+                func.sum(
+                    case((Task.status != TaskStatus.COMPLETED, 1), else_=0)
+                ).label("pending")
+            ).join(
+                Task, Task.id == TaskDependency.depends_on_id
+            ).filter(
+                TaskDependency.task_id.in_([t.id for t in dependent_tasks])
+            ).group_by(TaskDependency.task_id).all()
+            pending_deps = {row.task_id: row.pending or 0 for row in rows}
+
         unblocked_tasks = []
         still_blocked_tasks = []
-        
+
         for dep_task in dependent_tasks:
-            # Check if all dependencies are now complete
-            all_complete = True
-            for d in dep_task.dependencies:
-                dep_status = self.db.query(Task).filter(
-                    Task.id == d.depends_on_id
-                ).first()
-                if dep_status and dep_status.status != TaskStatus.COMPLETED:
-                    all_complete = False
-                    break
-            
+            # Complete when no pending dependencies remain
+            all_complete = pending_deps.get(dep_task.id, 0) == 0
+
             if all_complete and dep_task.status == TaskStatus.BLOCKED:
                 unblocked_tasks.append({
                     "id": dep_task.id,
@@ -174,14 +203,17 @@ class ExecutionAgent:
         threshold = threshold_hours or self.stale_threshold_hours
         cutoff = datetime.utcnow() - timedelta(hours=threshold)
         
+        # Oldest update first, so callers taking the top N get the most
+        # stale tasks without re-sorting
         stale_tasks = self.db.query(Task).filter(
             Task.status.in_([TaskStatus.IN_PROGRESS, TaskStatus.BLOCKED]),
             Task.last_update_at < cutoff
-        ).all()
-        
+        ).order_by(Task.last_update_at).all()
+
+        now = datetime.utcnow()
         results = []
         for task in stale_tasks:
-            hours_stale = (datetime.utcnow() - task.last_update_at).total_seconds() / 3600
+            hours_stale = (now - task.last_update_at).total_seconds() / 3600
             
             recommendation = "Request status update"
             if hours_stale > 72:
@@ -211,31 +243,42 @@ class ExecutionAgent:
         Returns:
             Health analysis with metrics and recommendations
         """
-        query = self.db.query(Task).filter(
+        now = datetime.utcnow()
+        stale_cutoff = now - timedelta(hours=self.stale_threshold_hours)
+
+        # Aggregate in the database instead of pulling every active task
+        # into Python and counting in loops
+        query = self.db.query(
+            func.count().label("total"),
+            func.sum(
+                case((Task.status == TaskStatus.BLOCKED, 1), else_=0)
+            ).label("blocked"),
+            func.sum(
+                case((Task.deadline < now, 1), else_=0)
+            ).label("overdue"),
+            func.sum(
+                case((Task.last_update_at < stale_cutoff, 1), else_=0)
+            ).label("stale")
+        ).filter(
             Task.status.not_in([TaskStatus.COMPLETED, TaskStatus.CANCELLED])
         )
-        
+
         if project_id:
             query = query.filter(Task.project_id == project_id)
-        
-        active_tasks = query.all()
-        
-        if not active_tasks:
+
+        row = query.one()
+        total = row.total or 0
+
+        if not total:
             return {
                 "health": "good",
                 "message": "No active tasks",
                 "metrics": {}
             }
-        
-        now = datetime.utcnow()
-        
-        # Calculate metrics
-        blocked = len([t for t in active_tasks if t.status == TaskStatus.BLOCKED])
-        overdue = len([t for t in active_tasks if t.deadline and t.deadline < now])
-        stale = len([t for t in active_tasks 
-                     if t.last_update_at and (now - t.last_update_at).total_seconds() / 3600 > 48])
-        
-        total = len(active_tasks)
+
+        blocked = row.blocked or 0
+        overdue = row.overdue or 0
+        stale = row.stale or 0
         blocked_rate = (blocked / total) * 100
         overdue_rate = (overdue / total) * 100
         stale_rate = (stale / total) * 100
@@ -277,10 +320,15 @@ class ExecutionAgent:
     def suggest_interventions(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Suggest interventions to improve execution.
-        
+
+        Interventions sharing an owner and type are merged into one entry
+        (with task_ids/task_names lists) so downstream notifications and
+        reminder generation fire once per owner, not once per task.
+
         Returns:
             List of suggested interventions with priority
         """
+        now = datetime.utcnow()
         interventions = []
         
         # Check for stale tasks
@@ -300,16 +348,32 @@ class ExecutionAgent:
         blocked_tasks = self.db.query(Task).filter(
             Task.status == TaskStatus.BLOCKED
         ).all()
-        
+
+        # Latest "blocked" transition for every blocked task in one
+        # windowed query instead of an ordered lookup per task
+        last_blocked_at = {}
+        if blocked_tasks:
+            sub = self.db.query(
+                TaskHistory.task_id,
+                TaskHistory.timestamp,
+                func.row_number().over(
+                    partition_by=TaskHistory.task_id,
+                    order_by=TaskHistory.timestamp.desc()
+                ).label("rn")
+            ).filter(
+                TaskHistory.new_value == "blocked",
+                TaskHistory.task_id.in_([t.id for t in blocked_tasks[:5]])
+            ).subquery()
+            last_blocked_at = {
+                row.task_id: row.timestamp
+                for row in self.db.query(sub).filter(sub.c.rn == 1).all()
+            }
+
         for task in blocked_tasks[:5]:
-            # Check how long blocked
-            last_blocked = self.db.query(TaskHistory).filter(
-                TaskHistory.task_id == task.id,
-                TaskHistory.new_value == "blocked"
-            ).order_by(TaskHistory.timestamp.desc()).first()
-            
+            last_blocked = last_blocked_at.get(task.id)
+
             if last_blocked:
-                hours_blocked = (datetime.utcnow() - last_blocked.timestamp).total_seconds() / 3600
+                hours_blocked = (now - last_blocked).total_seconds() / 3600
                 if hours_blocked > self.blocked_threshold_hours:
                     interventions.append({
                         "type": "escalation",
@@ -321,19 +385,71 @@ class ExecutionAgent:
                         "reason": f"Blocked for {round(hours_blocked, 1)} hours"
                     })
         
-        # Sort by priority
         priority_order = {"high": 0, "medium": 1, "low": 2}
-        interventions.sort(key=lambda x: priority_order.get(x["priority"], 2))
-        
-        return interventions
+
+        # Coalesce interventions that share an owner and type so one
+        # reminder/escalation covers all of that owner's tasks instead of
+        # firing a notification per task
+        interventions.sort(key=lambda x: (x["owner"] or "", x["type"]))
+        coalesced = []
+        for (owner, kind), group in groupby(
+            interventions, key=lambda x: (x["owner"], x["type"])
+        ):
+            group = list(group)
+            if len(group) == 1:
+                coalesced.append(group[0])
+                continue
+
+            self.interventions_coalesced += len(group) - 1
+            action = (
+                f"Request updates from {owner} on {len(group)} tasks"
+                if kind == "nudge"
+                else f"Escalate {len(group)} blockers for {owner} to project owner"
+            )
+            coalesced.append({
+                "type": kind,
+                "priority": min(
+                    (g["priority"] for g in group),
+                    key=lambda p: priority_order.get(p, 2)
+                ),
+                "task_ids": [g["task_id"] for g in group],
+                "task_names": [g["task_name"] for g in group],
+                "owner": owner,
+                "action": action,
+                "reason": "; ".join(f"{g['task_name']}: {g['reason']}" for g in group)
+            })
+
+        # Sort by priority: precompute keys once instead of a dict lookup
+        # per comparison, with input order as a deterministic tiebreak
+        decorated = [
+            (priority_order.get(item["priority"], 2), idx, item)
+            for idx, item in enumerate(coalesced)
+        ]
+        decorated.sort(key=lambda entry: entry[:2])
+
+        return [item for _, _, item in decorated]
     
+    def flush_activities(self):
+        """Commit all deferred decision-log rows in one transaction."""
+        if not self._pending_activities:
+            return
+        self.db.add_all(self._pending_activities)
+        self.db.commit()
+        self._pending_activities.clear()
+
     def _log_execution_decision(
         self,
         task_id: str,
         decision: str,
-        actions: List[Dict[str, Any]]
+        actions: List[Dict[str, Any]],
+        batch: bool = False
     ):
-        """Log an execution decision."""
+        """Log an execution decision.
+
+        With batch=True the row is held back and committed by
+        flush_activities(), so a loop of N updates costs one commit
+        instead of N.
+        """
         activity = AgentActivity(
             id=str(uuid.uuid4()),
             agent_name="ExecutionAgent",
@@ -342,5 +458,8 @@ class ExecutionAgent:
             related_task_id=task_id,
             activity_metadata=json.dumps({"actions": actions})
         )
+        if batch:
+            self._pending_activities.append(activity)
+            return
         self.db.add(activity)
         self.db.commit()
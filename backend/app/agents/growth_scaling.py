@@ -18,15 +18,82 @@ Operating Principles:
 """
 
 import uuid
-import json
+import numpy as np
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case, select, bindparam, Integer
+from backend.app.core import fastjson
 from backend.app.models import (
     JobRole, JobRoleStatus, Candidate, CandidateStage, Interview, InterviewStatus,
     OnboardingPlan, OnboardingTask, OnboardingStatus, KnowledgeArticle, ArticleStatus,
-    Employee, AgentActivity
+    Employee, AgentActivity, article_target_roles
+)
+
+
+# Identity lookups reuse one pre-built select per model so SQLAlchemy's
+# compiled-statement cache always hits instead of compiling a fresh
+# Query object on every call
+_SELECT_BY_ID = {
+    model: select(model).where(model.id == bindparam("id"))
+    for model in (JobRole, Candidate, Interview, Employee, OnboardingPlan)
+}
+
+
+# Standard 30-60-90 day onboarding goals; constant across plans, so the
+# lists (and their JSON form) are built once at import time
+_GOALS_30 = (
+    "Complete all account and tool setup",
+    "Review core documentation and processes",
+    "Meet with team members and key stakeholders",
+    "Understand team goals and current projects",
+    "Complete initial training modules"
+)
+
+_GOALS_60 = (
+    "Take ownership of first project or task area",
+    "Contribute to team discussions and planning",
+    "Build relationships across teams",
+    "Identify process improvements",
+    "Complete role-specific certifications if required"
+)
+
+_GOALS_90 = (
+    "Deliver measurable impact in primary responsibility",
+    "Mentor or support newer team members",
+    "Propose and implement at least one improvement",
+    "Establish regular feedback loop with manager",
+    "Set goals for next quarter"
+)
+
+_GOALS_30_JSON = fastjson.dumps(list(_GOALS_30))
+_GOALS_60_JSON = fastjson.dumps(list(_GOALS_60))
+_GOALS_90_JSON = fastjson.dumps(list(_GOALS_90))
+
+# Standard onboarding checklist assigned to every new hire
+_STANDARD_ONBOARDING_TASKS = (
+    # Day 1-3: Account setup
+    {"title": "Complete HR paperwork", "category": "account_setup", "day_due": 1},
+    {"title": "Set up email and calendar", "category": "account_setup", "day_due": 1},
+    {"title": "Get access to communication tools (Slack, Teams)", "category": "tool_access", "day_due": 1},
+    {"title": "Set up development environment", "category": "tool_access", "day_due": 2},
+    {"title": "Request access to required systems", "category": "tool_access", "day_due": 2},
+
+    # Day 3-7: Documentation review
+    {"title": "Review company handbook", "category": "documentation", "day_due": 3},
+    {"title": "Read team documentation and processes", "category": "documentation", "day_due": 5},
+    {"title": "Review current project documentation", "category": "documentation", "day_due": 7},
+
+    # Week 2: Initial assignments
+    {"title": "Complete introductory training", "category": "assignment", "day_due": 10},
+    {"title": "Shadow team member on project work", "category": "assignment", "day_due": 12},
+    {"title": "Take on first small task", "category": "assignment", "day_due": 14},
+
+    # Week 3-4: Integration
+    {"title": "Schedule 1:1s with key stakeholders", "category": "assignment", "day_due": 21},
+    {"title": "Present at team meeting", "category": "assignment", "day_due": 28},
+    {"title": "Complete 30-day check-in with manager", "category": "assignment", "day_due": 30}
 )
 
 
@@ -44,7 +111,50 @@ class GrowthScalingAgent:
     
     def __init__(self, db: Session):
         self.db = db
-    
+        self._defer_commit = False
+        self._activity_buffer: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Batch several agent calls into one transaction.
+
+        While the block is active, mutation methods flush instead of
+        committing, so N calls cost a single commit (and fsync) at the
+        end instead of one each. Rolls back if the block raises.
+        """
+        self._defer_commit = True
+        try:
+            yield self
+            self._flush_activity_buffer()
+            self.db.commit()
+        except Exception:
+            self._activity_buffer.clear()
+            self.db.rollback()
+            raise
+        finally:
+            self._defer_commit = False
+
+    def _commit(self):
+        """Commit, or just flush when inside a unit_of_work block."""
+        if self._defer_commit:
+            self.db.flush()
+        else:
+            self._flush_activity_buffer()
+            self.db.commit()
+
+    def _flush_activity_buffer(self):
+        """Write buffered activity rows with one executemany insert."""
+        if self._activity_buffer:
+            self.db.execute(AgentActivity.__table__.insert(), self._activity_buffer)
+            self._activity_buffer.clear()
+
+    def _get_by_id(self, model, entity_id):
+        """Fetch one row by primary key via the shared cached select."""
+        return self.db.execute(
+            _SELECT_BY_ID[model], {"id": entity_id}
+        ).scalar_one_or_none()
+
     # ==================== ROLE DEFINITION ====================
     
     def define_role_requirements(
@@ -68,28 +178,29 @@ class GrowthScalingAgent:
         must-have vs nice-to-have, and success criteria.
         """
         role = JobRole(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             title=title,
             team=team,
-            responsibilities=json.dumps(responsibilities),
-            required_skills=json.dumps(required_skills),
-            nice_to_have_skills=json.dumps(nice_to_have_skills or []),
+            responsibilities=fastjson.dumps(responsibilities),
+            required_skills=fastjson.dumps(required_skills),
+            nice_to_have_skills=fastjson.dumps(nice_to_have_skills or []),
             experience_years=experience_years,
             seniority_level=seniority_level,
             location=location,
             work_mode=work_mode,
             reports_to=reports_to,
-            success_criteria=json.dumps(success_criteria or [])
+            success_criteria=fastjson.dumps(success_criteria or [])
         )
         self.db.add(role)
         
+        role_id = role.id
+
         self._log_activity(f"Defined role requirements: {title} for {team}")
-        
-        self.db.commit()
-        self.db.refresh(role)
-        
+
+        self._commit()
+
         return {
-            "role_id": role.id,
+            "role_id": role_id,
             "title": title,
             "team": team,
             "responsibilities": responsibilities,
@@ -101,73 +212,102 @@ class GrowthScalingAgent:
             "next_step": "Generate job description and get human approval"
         }
     
+    @staticmethod
+    def _render_jd(
+        title: str,
+        team: str,
+        department: Optional[str],
+        location: Optional[str],
+        work_mode: str,
+        reports_to: Optional[str],
+        seniority_level: str,
+        experience_years: int,
+        responsibilities: List[str],
+        required_skills: List[str],
+        nice_to_have: List[str],
+        success_criteria: List[str]
+    ) -> str:
+        """
+        Render a job description from already-parsed role fields.
+
+        Pure function: sections are assembled as whole blocks (literals
+        plus bullet comprehensions) rather than one append per line.
+        """
+        jd_sections = [
+            f"# {title}",
+            f"\n**Team:** {team}"
+        ]
+        if department:
+            jd_sections.append(f"**Department:** {department}")
+        jd_sections += [
+            f"**Location:** {location or 'Flexible'}",
+            f"**Work Mode:** {work_mode}"
+        ]
+        if reports_to:
+            jd_sections.append(f"**Reports To:** {reports_to}")
+
+        jd_sections += [
+            "\n## About the Role",
+            f"We are looking for a {seniority_level} {title} to join our {team} team."
+        ]
+
+        if responsibilities:
+            jd_sections.append("\n## Responsibilities")
+            jd_sections.extend(f"- {resp}" for resp in responsibilities)
+
+        if required_skills:
+            jd_sections += [
+                "\n## Required Skills & Experience",
+                f"- {experience_years}+ years of relevant experience"
+            ]
+            jd_sections.extend(f"- {skill}" for skill in required_skills)
+
+        if nice_to_have:
+            jd_sections.append("\n## Nice to Have")
+            jd_sections.extend(f"- {skill}" for skill in nice_to_have)
+
+        if success_criteria:
+            jd_sections.append("\n## What Success Looks Like")
+            jd_sections.extend(f"- {criteria}" for criteria in success_criteria)
+
+        jd_sections += [
+            "\n## Growth Opportunities",
+            "- Mentorship and learning opportunities",
+            "- Path to senior/lead roles",
+            "- Cross-team collaboration"
+        ]
+
+        return "\n".join(jd_sections)
+
     def generate_job_description(self, role_id: str) -> Dict[str, Any]:
         """
         Generate a professional job description from role requirements.
-        
+
         Job descriptions must:
         - Reflect real responsibilities
         - Avoid unnecessary jargon
         - State expectations and growth opportunities
         - Include location, work mode, and reporting structure
         """
-        role = self.db.query(JobRole).filter(JobRole.id == role_id).first()
+        role = self._get_by_id(JobRole, role_id)
         if not role:
             return {"error": "Role not found"}
-        
-        responsibilities = json.loads(role.responsibilities or "[]")
-        required_skills = json.loads(role.required_skills or "[]")
-        nice_to_have = json.loads(role.nice_to_have_skills or "[]")
-        success_criteria = json.loads(role.success_criteria or "[]")
-        
-        # Generate structured JD
-        jd_sections = []
-        
-        jd_sections.append(f"# {role.title}")
-        jd_sections.append(f"\n**Team:** {role.team}")
-        if role.department:
-            jd_sections.append(f"**Department:** {role.department}")
-        jd_sections.append(f"**Location:** {role.location or 'Flexible'}")
-        jd_sections.append(f"**Work Mode:** {role.work_mode}")
-        if role.reports_to:
-            jd_sections.append(f"**Reports To:** {role.reports_to}")
-        
-        jd_sections.append("\n## About the Role")
-        jd_sections.append(f"We are looking for a {role.seniority_level} {role.title} to join our {role.team} team.")
-        
-        if responsibilities:
-            jd_sections.append("\n## Responsibilities")
-            for resp in responsibilities:
-                jd_sections.append(f"- {resp}")
-        
-        if required_skills:
-            jd_sections.append("\n## Required Skills & Experience")
-            jd_sections.append(f"- {role.experience_years}+ years of relevant experience")
-            for skill in required_skills:
-                jd_sections.append(f"- {skill}")
-        
-        if nice_to_have:
-            jd_sections.append("\n## Nice to Have")
-            for skill in nice_to_have:
-                jd_sections.append(f"- {skill}")
-        
-        if success_criteria:
-            jd_sections.append("\n## What Success Looks Like")
-            for criteria in success_criteria:
-                jd_sections.append(f"- {criteria}")
-        
-        jd_sections.append("\n## Growth Opportunities")
-        jd_sections.append("- Mentorship and learning opportunities")
-        jd_sections.append("- Path to senior/lead roles")
-        jd_sections.append("- Cross-team collaboration")
-        
-        job_description = "\n".join(jd_sections)
-        
+
+        job_description = self._render_jd(
+            role.title, role.team, role.department, role.location,
+            role.work_mode, role.reports_to, role.seniority_level,
+            role.experience_years,
+            fastjson.loads(role.responsibilities or "[]"),
+            fastjson.loads(role.required_skills or "[]"),
+            fastjson.loads(role.nice_to_have_skills or "[]"),
+            fastjson.loads(role.success_criteria or "[]")
+        )
+
         role.job_description = job_description
-        self.db.commit()
-        
+        self._commit()
+
         self._log_activity(f"Generated job description for: {role.title}")
-        
+
         return {
             "role_id": role_id,
             "title": role.title,
@@ -176,6 +316,36 @@ class GrowthScalingAgent:
             "requires_approval": True,
             "next_step": "Review and approve before posting"
         }
+
+    def define_and_generate(self, **kwargs) -> Dict[str, Any]:
+        """
+        Define a role and generate its job description in one pass.
+
+        Renders the JD from the lists already in memory, skipping the
+        re-read and four JSON parses the two-step flow pays.
+        """
+        result = self.define_role_requirements(**kwargs)
+
+        # define_role_requirements does not take a department, so the
+        # rendered JD has none either
+        job_description = self._render_jd(
+            kwargs["title"], kwargs["team"], None,
+            kwargs.get("location"),
+            kwargs.get("work_mode", "hybrid"), kwargs.get("reports_to"),
+            kwargs.get("seniority_level", "mid"),
+            kwargs.get("experience_years", 0),
+            kwargs["responsibilities"], kwargs["required_skills"],
+            kwargs.get("nice_to_have_skills") or [],
+            kwargs.get("success_criteria") or []
+        )
+
+        self.db.query(JobRole).filter(JobRole.id == result["role_id"]).update(
+            {JobRole.job_description: job_description}, synchronize_session=False
+        )
+        self._commit()
+
+        result["job_description"] = job_description
+        return result
     
     def approve_job_posting(
         self,
@@ -187,7 +357,7 @@ class GrowthScalingAgent:
         
         Constraint: Do not post without human approval.
         """
-        role = self.db.query(JobRole).filter(JobRole.id == role_id).first()
+        role = self._get_by_id(JobRole, role_id)
         if not role:
             return {"error": "Role not found"}
         
@@ -198,7 +368,7 @@ class GrowthScalingAgent:
         
         self._log_activity(f"Job posting approved by {approved_by}: {role.title}")
         
-        self.db.commit()
+        self._commit()
         
         return {
             "role_id": role_id,
@@ -210,19 +380,27 @@ class GrowthScalingAgent:
     
     def get_open_roles(self) -> List[Dict[str, Any]]:
         """Get all open job roles."""
-        roles = self.db.query(JobRole).filter(
+        # Count candidates in the same query; len(r.candidates) would
+        # lazy-load the whole candidate list per role (N+1). Plain column
+        # rows skip ORM instance construction for this read-only listing.
+        rows = self.db.query(
+            JobRole.id, JobRole.title, JobRole.team, JobRole.seniority_level,
+            JobRole.work_mode, JobRole.created_at, func.count(Candidate.id)
+        ).outerjoin(
+            Candidate, Candidate.job_role_id == JobRole.id
+        ).filter(
             JobRole.status == JobRoleStatus.OPEN
-        ).all()
-        
+        ).group_by(JobRole.id).all()
+
         return [{
-            "id": r.id,
-            "title": r.title,
-            "team": r.team,
-            "seniority_level": r.seniority_level,
-            "work_mode": r.work_mode,
-            "candidate_count": len(r.candidates),
-            "created_at": r.created_at.isoformat()
-        } for r in roles]
+            "id": role_id,
+            "title": title,
+            "team": team,
+            "seniority_level": seniority_level,
+            "work_mode": work_mode,
+            "candidate_count": candidate_count,
+            "created_at": created_at.isoformat()
+        } for role_id, title, team, seniority_level, work_mode, created_at, candidate_count in rows]
     
     # ==================== CANDIDATE PIPELINE ====================
     
@@ -236,12 +414,12 @@ class GrowthScalingAgent:
         source: str = "website"
     ) -> Dict[str, Any]:
         """Add a new candidate to the pipeline."""
-        role = self.db.query(JobRole).filter(JobRole.id == job_role_id).first()
+        role = self._get_by_id(JobRole, job_role_id)
         if not role:
             return {"error": "Job role not found"}
         
         candidate = Candidate(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             job_role_id=job_role_id,
             name=name,
             email=email,
@@ -252,13 +430,14 @@ class GrowthScalingAgent:
         )
         self.db.add(candidate)
         
+        candidate_id = candidate.id
+
         self._log_activity(f"New candidate added: {name} for {role.title}")
-        
-        self.db.commit()
-        self.db.refresh(candidate)
-        
+
+        self._commit()
+
         return {
-            "candidate_id": candidate.id,
+            "candidate_id": candidate_id,
             "name": name,
             "role": role.title,
             "stage": "applied",
@@ -274,11 +453,16 @@ class GrowthScalingAgent:
         
         Maintains up-to-date candidate status, avoids stale candidates.
         """
-        query = self.db.query(Candidate)
-        
+        # Fetch only the columns the pipeline needs; plain rows cannot
+        # trigger lazy loads and skip ORM instance construction entirely
+        query = self.db.query(
+            Candidate.id, Candidate.name, Candidate.email,
+            Candidate.source, Candidate.updated_at, Candidate.stage
+        )
+
         if job_role_id:
             query = query.filter(Candidate.job_role_id == job_role_id)
-        
+
         candidates = query.all()
         
         pipeline = {
@@ -291,27 +475,39 @@ class GrowthScalingAgent:
         }
         
         stale_candidates = []
-        stale_threshold = datetime.utcnow() - timedelta(days=14)
-        
-        for c in candidates:
+        now = datetime.utcnow()
+        stale_threshold = now - timedelta(days=14)
+        terminal_stages = {CandidateStage.HIRED, CandidateStage.REJECTED}
+
+        # Age arithmetic with columnar NumPy ops instead of per-row
+        # datetime subtraction
+        if candidates:
+            updated = np.array([c.updated_at for c in candidates], dtype="datetime64[s]")
+            days_in_stage = np.floor(
+                (np.datetime64(now) - updated) / np.timedelta64(1, "D")
+            ).astype(np.int64)
+            stale_mask = updated < np.datetime64(stale_threshold)
+
+        for i, c in enumerate(candidates):
+            days = int(days_in_stage[i])
             candidate_data = {
                 "id": c.id,
                 "name": c.name,
                 "email": c.email,
                 "source": c.source,
                 "updated_at": c.updated_at.isoformat(),
-                "days_in_stage": (datetime.utcnow() - c.updated_at).days
+                "days_in_stage": days
             }
-            
+
             pipeline[c.stage.value].append(candidate_data)
-            
+
             # Flag stale candidates
-            if c.updated_at < stale_threshold and c.stage not in [CandidateStage.HIRED, CandidateStage.REJECTED]:
+            if stale_mask[i] and c.stage not in terminal_stages:
                 stale_candidates.append({
                     "id": c.id,
                     "name": c.name,
                     "stage": c.stage.value,
-                    "days_stale": (datetime.utcnow() - c.updated_at).days
+                    "days_stale": days
                 })
         
         return {
@@ -334,7 +530,7 @@ class GrowthScalingAgent:
         
         IMPORTANT: Rejections require human approval (approved_by).
         """
-        candidate = self.db.query(Candidate).filter(Candidate.id == candidate_id).first()
+        candidate = self._get_by_id(Candidate, candidate_id)
         if not candidate:
             return {"error": "Candidate not found"}
         
@@ -357,7 +553,7 @@ class GrowthScalingAgent:
             f"Candidate {candidate.name} moved from {old_stage} to {new_stage}"
         )
         
-        self.db.commit()
+        self._commit()
         
         return {
             "candidate_id": candidate_id,
@@ -366,7 +562,50 @@ class GrowthScalingAgent:
             "new_stage": new_stage,
             "updated_at": candidate.updated_at.isoformat()
         }
-    
+
+    def bulk_update_stage(
+        self,
+        candidate_ids: List[str],
+        new_stage: str,
+        approved_by: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Move a batch of candidates to the same stage with one UPDATE.
+
+        For programmatic transitions (e.g. closing out a filled role)
+        this replaces N SELECT-mutate-commit cycles with a single
+        statement. Rejections still require human approval.
+        """
+        if not candidate_ids:
+            return {"updated": 0, "new_stage": new_stage}
+
+        # Rejection requires human approval
+        if new_stage == "rejected" and not approved_by:
+            return {
+                "error": "Rejection requires human approval",
+                "requires_approval": True,
+                "action": "Provide approved_by to confirm rejection"
+            }
+
+        values: Dict[str, Any] = {
+            "stage": CandidateStage(new_stage),
+            "updated_at": datetime.utcnow()
+        }
+        if new_stage == "rejected":
+            values["rejection_approved_by"] = approved_by
+
+        updated = self.db.query(Candidate).filter(
+            Candidate.id.in_(candidate_ids)
+        ).update(values, synchronize_session=False)
+
+        self._log_activity(
+            f"Bulk stage update: {updated} candidate(s) moved to {new_stage}"
+        )
+
+        self._commit()
+
+        return {"updated": updated, "new_stage": new_stage}
+
     # ==================== INTERVIEW SCHEDULING ====================
     
     def schedule_interview(
@@ -387,43 +626,53 @@ class GrowthScalingAgent:
         - Avoid back-to-back overload
         - Include clear interview agenda
         """
-        candidate = self.db.query(Candidate).filter(Candidate.id == candidate_id).first()
-        if not candidate:
+        # Fetch just the fields needed plus the interview count (for the
+        # round number) in a single grouped query instead of two round
+        # trips on the full candidate row
+        row = self.db.query(
+            Candidate.name, Candidate.stage, func.count(Interview.id)
+        ).outerjoin(
+            Interview, Interview.candidate_id == Candidate.id
+        ).filter(
+            Candidate.id == candidate_id
+        ).group_by(Candidate.id).first()
+        if not row:
             return {"error": "Candidate not found"}
-        
-        # Count existing interviews to determine round
-        existing = self.db.query(Interview).filter(
-            Interview.candidate_id == candidate_id
-        ).count()
+        candidate_name, candidate_stage, existing = row
         
         interview = Interview(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             candidate_id=candidate_id,
             round_number=existing + 1,
             interview_type=interview_type,
-            interviewers=json.dumps(interviewers),
+            interviewers=fastjson.dumps(interviewers),
             scheduled_time=scheduled_time,
             duration_minutes=duration_minutes,
             location=location,
-            agenda=agenda or f"Interview agenda for {candidate.name}"
+            agenda=agenda or f"Interview agenda for {candidate_name}"
         )
         self.db.add(interview)
-        
+
         # Update candidate stage if needed
-        if candidate.stage == CandidateStage.SCREENING:
-            candidate.stage = CandidateStage.INTERVIEWING
-        
+        if candidate_stage == CandidateStage.SCREENING:
+            self.db.query(Candidate).filter(Candidate.id == candidate_id).update(
+                {Candidate.stage: CandidateStage.INTERVIEWING},
+                synchronize_session=False
+            )
+
         self._log_activity(
-            f"Interview scheduled: {candidate.name} with {interviewers} on {scheduled_time.date()}"
+            f"Interview scheduled: {candidate_name} with {interviewers} on {scheduled_time.date()}"
         )
         
-        self.db.commit()
-        self.db.refresh(interview)
-        
+        interview_id = interview.id
+        round_number = interview.round_number
+
+        self._commit()
+
         return {
-            "interview_id": interview.id,
-            "candidate": candidate.name,
-            "round": interview.round_number,
+            "interview_id": interview_id,
+            "candidate": candidate_name,
+            "round": round_number,
             "type": interview_type,
             "scheduled_time": scheduled_time.isoformat(),
             "interviewers": interviewers,
@@ -447,20 +696,20 @@ class GrowthScalingAgent:
         - Avoid subjective or biased language
         - Clearly separate facts from opinions
         """
-        interview = self.db.query(Interview).filter(Interview.id == interview_id).first()
+        interview = self._get_by_id(Interview, interview_id)
         if not interview:
             return {"error": "Interview not found"}
         
-        interview.feedback = json.dumps(feedback)
-        interview.strengths = json.dumps(strengths)
-        interview.concerns = json.dumps(concerns)
+        interview.feedback = fastjson.dumps(feedback)
+        interview.strengths = fastjson.dumps(strengths)
+        interview.concerns = fastjson.dumps(concerns)
         interview.recommendation = recommendation
         interview.status = InterviewStatus.COMPLETED
         
         # Generate summary
         summary_parts = []
         summary_parts.append(f"**Interview Round {interview.round_number}: {interview.interview_type}**")
-        summary_parts.append(f"\n**Interviewers:** {', '.join(json.loads(interview.interviewers))}")
+        summary_parts.append(f"\n**Interviewers:** {', '.join(fastjson.loads(interview.interviewers))}")
         
         if strengths:
             summary_parts.append("\n**Strengths (observed):**")
@@ -480,7 +729,7 @@ class GrowthScalingAgent:
             f"Interview feedback recorded for candidate {interview.candidate_id}"
         )
         
-        self.db.commit()
+        self._commit()
         
         return {
             "interview_id": interview_id,
@@ -508,61 +757,38 @@ class GrowthScalingAgent:
         - Cover first 30–60–90 days
         - Include learning, setup, and delivery goals
         """
-        employee = self.db.query(Employee).filter(Employee.id == employee_id).first()
+        employee = self._get_by_id(Employee, employee_id)
         if not employee:
             return {"error": "Employee not found"}
         
-        # Generate role-appropriate goals
-        goals_30 = [
-            "Complete all account and tool setup",
-            "Review core documentation and processes",
-            "Meet with team members and key stakeholders",
-            "Understand team goals and current projects",
-            "Complete initial training modules"
-        ]
-        
-        goals_60 = [
-            "Take ownership of first project or task area",
-            "Contribute to team discussions and planning",
-            "Build relationships across teams",
-            "Identify process improvements",
-            "Complete role-specific certifications if required"
-        ]
-        
-        goals_90 = [
-            "Deliver measurable impact in primary responsibility",
-            "Mentor or support newer team members",
-            "Propose and implement at least one improvement",
-            "Establish regular feedback loop with manager",
-            "Set goals for next quarter"
-        ]
-        
         plan = OnboardingPlan(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             employee_id=employee_id,
             role=role,
             start_date=start_date,
-            goals_30_days=json.dumps(goals_30),
-            goals_60_days=json.dumps(goals_60),
-            goals_90_days=json.dumps(goals_90),
+            goals_30_days=_GOALS_30_JSON,
+            goals_60_days=_GOALS_60_JSON,
+            goals_90_days=_GOALS_90_JSON,
             buddy_name=buddy_name,
             mentor_name=mentor_name
         )
         self.db.add(plan)
         
-        self._log_activity(f"Generated onboarding plan for {employee.name}")
-        
-        self.db.commit()
-        self.db.refresh(plan)
-        
+        plan_id = plan.id
+        employee_name = employee.name
+
+        self._log_activity(f"Generated onboarding plan for {employee_name}")
+
+        self._commit()
+
         return {
-            "plan_id": plan.id,
-            "employee": employee.name,
+            "plan_id": plan_id,
+            "employee": employee_name,
             "role": role,
             "start_date": start_date.isoformat(),
-            "goals_30_days": goals_30,
-            "goals_60_days": goals_60,
-            "goals_90_days": goals_90,
+            "goals_30_days": list(_GOALS_30),
+            "goals_60_days": list(_GOALS_60),
+            "goals_90_days": list(_GOALS_90),
             "buddy": buddy_name,
             "mentor": mentor_name,
             "next_step": "Assign onboarding tasks"
@@ -575,51 +801,33 @@ class GrowthScalingAgent:
         Tasks include: account setup, tool access, documentation review, initial assignments.
         Tasks must be tracked like standard project tasks.
         """
-        plan = self.db.query(OnboardingPlan).filter(OnboardingPlan.id == plan_id).first()
-        if not plan:
+        # Existence check only — no need to ship the plan row (three
+        # goals JSON blobs) over just to flip its status below
+        exists = self.db.query(OnboardingPlan.id).filter(
+            OnboardingPlan.id == plan_id
+        ).first()
+        if not exists:
             return {"error": "Onboarding plan not found"}
-        
-        standard_tasks = [
-            # Day 1-3: Account setup
-            {"title": "Complete HR paperwork", "category": "account_setup", "day_due": 1},
-            {"title": "Set up email and calendar", "category": "account_setup", "day_due": 1},
-            {"title": "Get access to communication tools (Slack, Teams)", "category": "tool_access", "day_due": 1},
-            {"title": "Set up development environment", "category": "tool_access", "day_due": 2},
-            {"title": "Request access to required systems", "category": "tool_access", "day_due": 2},
-            
-            # Day 3-7: Documentation review
-            {"title": "Review company handbook", "category": "documentation", "day_due": 3},
-            {"title": "Read team documentation and processes", "category": "documentation", "day_due": 5},
-            {"title": "Review current project documentation", "category": "documentation", "day_due": 7},
-            
-            # Week 2: Initial assignments
-            {"title": "Complete introductory training", "category": "assignment", "day_due": 10},
-            {"title": "Shadow team member on project work", "category": "assignment", "day_due": 12},
-            {"title": "Take on first small task", "category": "assignment", "day_due": 14},
-            
-            # Week 3-4: Integration
-            {"title": "Schedule 1:1s with key stakeholders", "category": "assignment", "day_due": 21},
-            {"title": "Present at team meeting", "category": "assignment", "day_due": 28},
-            {"title": "Complete 30-day check-in with manager", "category": "assignment", "day_due": 30}
-        ]
-        
-        created_tasks = []
-        for task_data in standard_tasks:
-            task = OnboardingTask(
-                id=str(uuid.uuid4()),
-                plan_id=plan_id,
-                title=task_data["title"],
-                category=task_data["category"],
-                day_due=task_data["day_due"]
-            )
-            self.db.add(task)
-            created_tasks.append(task_data)
-        
-        plan.status = OnboardingStatus.IN_PROGRESS
+
+        # Insert the whole checklist with one executemany statement
+        # instead of 14 ORM-tracked inserts
+        self.db.execute(
+            OnboardingTask.__table__.insert(),
+            [
+                {"id": uuid.uuid4().hex, "plan_id": plan_id, **task_data}
+                for task_data in _STANDARD_ONBOARDING_TASKS
+            ]
+        )
+        created_tasks = list(_STANDARD_ONBOARDING_TASKS)
+
+        self.db.query(OnboardingPlan).filter(OnboardingPlan.id == plan_id).update(
+            {OnboardingPlan.status: OnboardingStatus.IN_PROGRESS},
+            synchronize_session=False
+        )
         
         self._log_activity(f"Assigned {len(created_tasks)} onboarding tasks for plan {plan_id}")
         
-        self.db.commit()
+        self._commit()
         
         return {
             "plan_id": plan_id,
@@ -629,40 +837,91 @@ class GrowthScalingAgent:
     
     def get_onboarding_progress(self, plan_id: str) -> Dict[str, Any]:
         """Get onboarding progress for an employee."""
-        plan = self.db.query(OnboardingPlan).filter(OnboardingPlan.id == plan_id).first()
+        plan = self._get_by_id(OnboardingPlan, plan_id)
         if not plan:
             return {"error": "Onboarding plan not found"}
         
-        tasks = self.db.query(OnboardingTask).filter(OnboardingTask.plan_id == plan_id).all()
-        
-        completed = sum(1 for t in tasks if t.is_completed)
-        total = len(tasks)
-        
-        by_category = {}
-        for task in tasks:
-            if task.category not in by_category:
-                by_category[task.category] = {"total": 0, "completed": 0}
-            by_category[task.category]["total"] += 1
-            if task.is_completed:
-                by_category[task.category]["completed"] += 1
-        
-        plan.completion_percentage = int((completed / total * 100) if total > 0 else 0)
-        self.db.commit()
+        # Aggregate in the database: one row per category instead of
+        # fetching every task and counting in Python
+        rows = self.db.query(
+            OnboardingTask.category,
+            func.count(),
+            func.sum(case((OnboardingTask.is_completed, 1), else_=0))
+        ).filter(
+            OnboardingTask.plan_id == plan_id
+        ).group_by(OnboardingTask.category).all()
+
+        by_category = {
+            category: {"total": cat_total, "completed": int(cat_done)}
+            for category, cat_total, cat_done in rows
+        }
+        total = sum(cat_total for _, cat_total, _ in rows)
+        completed = sum(int(cat_done) for _, _, cat_done in rows)
         
+        # Pure read: the stored completion_percentage is maintained by
+        # complete_onboarding_task, so this endpoint no longer writes
+        completion_percentage = int((completed / total * 100) if total > 0 else 0)
+
         return {
             "plan_id": plan_id,
             "role": plan.role,
             "start_date": plan.start_date.isoformat(),
             "status": plan.status.value,
-            "completion_percentage": plan.completion_percentage,
+            "completion_percentage": completion_percentage,
             "tasks_completed": completed,
             "tasks_total": total,
             "by_category": by_category,
-            "goals_30_days": json.loads(plan.goals_30_days or "[]"),
-            "goals_60_days": json.loads(plan.goals_60_days or "[]"),
-            "goals_90_days": json.loads(plan.goals_90_days or "[]")
+            "goals_30_days": fastjson.loads(plan.goals_30_days or "[]"),
+            "goals_60_days": fastjson.loads(plan.goals_60_days or "[]"),
+            "goals_90_days": fastjson.loads(plan.goals_90_days or "[]")
         }
-    
+
+    def complete_onboarding_task(self, task_id: str) -> Dict[str, Any]:
+        """
+        Mark an onboarding task as completed.
+
+        The plan's stored completion_percentage is refreshed here, at
+        write time, so progress reads stay pure reads.
+        """
+        task = self.db.query(OnboardingTask).filter(
+            OnboardingTask.id == task_id
+        ).first()
+        if not task:
+            return {"error": "Onboarding task not found"}
+
+        task.is_completed = True
+        task.completed_at = datetime.utcnow()
+        plan_id = task.plan_id
+        title = task.title
+
+        # Recompute the plan's completion in one correlated UPDATE
+        progress = self.db.query(
+            func.cast(
+                100 * func.sum(case((OnboardingTask.is_completed, 1), else_=0))
+                / func.count(),
+                Integer
+            ).label("pct")
+        ).filter(
+            OnboardingTask.plan_id == task.plan_id
+        ).scalar_subquery()
+        self.db.query(OnboardingPlan).filter(
+            OnboardingPlan.id == task.plan_id
+        ).update(
+            {OnboardingPlan.completion_percentage: progress},
+            synchronize_session=False
+        )
+
+        self._log_activity(f"Onboarding task completed: {title}")
+
+        self._commit()
+
+        return {
+            "task_id": task_id,
+            "plan_id": plan_id,
+            "title": title,
+            "is_completed": True
+        }
+
     # ==================== KNOWLEDGE BASE ====================
     
     def add_knowledge_article(
@@ -679,25 +938,35 @@ class GrowthScalingAgent:
         summary = content[:200] + "..." if len(content) > 200 else content
         
         article = KnowledgeArticle(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             title=title,
             content=content,
             summary=summary,
             category=category,
-            tags=json.dumps(tags or []),
+            tags=fastjson.dumps(tags or []),
             author=author,
-            target_roles=json.dumps(target_roles or []),
+            target_roles=fastjson.dumps(target_roles or []),
             status=ArticleStatus.DRAFT
         )
         self.db.add(article)
-        
+
+        # Mirror target_roles into the association table so role lookups
+        # hit an index instead of substring-matching the JSON text
+        if target_roles:
+            self.db.flush()  # article row must exist before the FK rows
+            self.db.execute(
+                article_target_roles.insert(),
+                [{"article_id": article.id, "role": r} for r in target_roles]
+            )
+
+        article_id = article.id
+
         self._log_activity(f"Knowledge article created: {title}")
-        
-        self.db.commit()
-        self.db.refresh(article)
-        
+
+        self._commit()
+
         return {
-            "article_id": article.id,
+            "article_id": article_id,
             "title": title,
             "category": category,
             "status": "draft",
@@ -715,35 +984,59 @@ class GrowthScalingAgent:
         
         Behavior: Answer based on internal knowledge base, cite sources when possible.
         """
-        db_query = self.db.query(KnowledgeArticle).filter(
+        # Column rows only: the read path never mutates the articles, so
+        # skip ORM hydration (and avoid dragging full content bodies over)
+        db_query = self.db.query(
+            KnowledgeArticle.id, KnowledgeArticle.title,
+            KnowledgeArticle.summary, KnowledgeArticle.category,
+            KnowledgeArticle.author, KnowledgeArticle.tags,
+            KnowledgeArticle.is_outdated
+        ).filter(
             KnowledgeArticle.status == ArticleStatus.PUBLISHED
         )
         
         if category:
             db_query = db_query.filter(KnowledgeArticle.category == category)
         
-        # Simple keyword search
-        db_query = db_query.filter(
-            KnowledgeArticle.title.ilike(f"%{query}%") | 
-            KnowledgeArticle.content.ilike(f"%{query}%")
-        )
+        # Full-text search on Postgres (backed by a GIN index); simple
+        # keyword ILIKE scan on other dialects
+        if self.db.get_bind().dialect.name == "postgresql":
+            db_query = db_query.filter(
+                func.to_tsvector(
+                    'english',
+                    KnowledgeArticle.title + ' ' + KnowledgeArticle.content
+                ).op('@@')(func.plainto_tsquery('english', query))
+            )
+        else:
+            db_query = db_query.filter(
+                KnowledgeArticle.title.ilike(f"%{query}%") |
+                KnowledgeArticle.content.ilike(f"%{query}%")
+            )
         
         articles = db_query.limit(limit).all()
-        
-        # Update view counts
-        for article in articles:
-            article.view_count += 1
-        self.db.commit()
-        
-        return [{
+
+        results = [{
             "id": a.id,
             "title": a.title,
             "summary": a.summary,
             "category": a.category,
             "author": a.author,
-            "tags": json.loads(a.tags or "[]"),
+            "tags": fastjson.loads(a.tags or "[]"),
             "is_outdated": a.is_outdated
         } for a in articles]
+
+        # Update view counts with one bulk UPDATE instead of one dirty
+        # row (and UPDATE statement) per article
+        if articles:
+            self.db.query(KnowledgeArticle).filter(
+                KnowledgeArticle.id.in_([a.id for a in articles])
+            ).update(
+                {KnowledgeArticle.view_count: KnowledgeArticle.view_count + 1},
+                synchronize_session=False
+            )
+            self._commit()
+
+        return results
     
     def flag_outdated_article(
         self,
@@ -766,7 +1059,7 @@ class GrowthScalingAgent:
         
         self._log_activity(f"Article flagged as outdated: {article.title}")
         
-        self.db.commit()
+        self._commit()
         
         return {
             "article_id": article_id,
@@ -786,12 +1079,18 @@ class GrowthScalingAgent:
         - Curate relevant documents
         - Avoid overwhelming new hires
         """
-        articles = self.db.query(KnowledgeArticle).filter(
+        articles = self.db.query(
+            KnowledgeArticle.id, KnowledgeArticle.title,
+            KnowledgeArticle.summary, KnowledgeArticle.category
+        ).join(
+            article_target_roles,
+            article_target_roles.c.article_id == KnowledgeArticle.id
+        ).filter(
             KnowledgeArticle.status == ArticleStatus.PUBLISHED,
             KnowledgeArticle.is_outdated == False,
-            KnowledgeArticle.target_roles.ilike(f"%{role}%")
+            article_target_roles.c.role == role
         ).limit(10).all()
-        
+
         return [{
             "id": a.id,
             "title": a.title,
@@ -802,11 +1101,17 @@ class GrowthScalingAgent:
     # ==================== ACTIVITY LOGGING ====================
     
     def _log_activity(self, message: str):
-        """Log growth & scaling activity."""
-        activity = AgentActivity(
-            id=str(uuid.uuid4()),
-            agent_name="GrowthScalingAgent",
-            activity_type="action",
-            message=message
-        )
-        self.db.add(activity)
+        """
+        Log growth & scaling activity.
+
+        Activity rows are fire-and-forget, so they accumulate in a
+        buffer and are written in bulk by the next commit instead of
+        being tracked individually by the unit of work.
+        """
+        self._activity_buffer.append({
+            "id": uuid.uuid4().hex,
+            "agent_name": "GrowthScalingAgent",
+            "activity_type": "action",
+            "message": message,
+            "timestamp": datetime.utcnow()
+        })
@@ -1,7 +1,15 @@
 import os
 import json
+import uuid
+import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
-from openai import OpenAI
+import jiter
+import numpy as np
+from backend.app.agents._http import get_sync_client, get_async_client
+from backend.app.core import fastjson
+from backend.app.core.logging import logger
 from backend.app.schemas.managerial import (
     RiskAnalysisResponse, StandupResponse, ReportResponse,
     StructuredGoal, ConversationSummary, StakeholderQueryResponse, ReminderResponse
@@ -35,42 +43,27 @@ OUTPUT REQUIREMENTS:
 """
 
 
-class ManagerialAgent:
-    """
-    Enhanced Managerial Intelligence Agent.
-    Implements all capabilities from the Priority 1 Managerial Intelligence Prompt.
-    """
-    
-    def __init__(self):
-        self.api_key = os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            print("Warning: OPENAI_API_KEY not found in environment variables.")
-        self.client = OpenAI(api_key=self.api_key) if self.api_key else None
-        self.model = "gpt-4o"
+# Hoisted once so every request reuses the identical system-message dict
+# instead of rebuilding it per call. Keeping the leading prefix of the
+# request byte-identical also lets OpenAI's server-side prompt cache
+# elide re-encoding the static system prompt (lower TTFT and cost); no
+# per-request data may ever be embedded in it.
+_SYSTEM_MSG = {"role": "system", "content": MANAGERIAL_SYSTEM_PROMPT}
+_BASE_MESSAGES = (_SYSTEM_MSG,)
 
-    def _query_llm(self, user_content: str, response_format=None) -> str:
-        if not self.client:
-            raise ValueError("OpenAI API key not configured")
-            
-        messages = [
-            {"role": "system", "content": MANAGERIAL_SYSTEM_PROMPT},
-            {"role": "user", "content": user_content}
-        ]
-        kwargs = {"model": self.model, "messages": messages}
-        if response_format:
-            kwargs["response_format"] = response_format
+# Identical prompts (scheduled standups with unchanged inputs) are common
+# enough that an exact-match tier in front of the semantic cache pays for
+# itself: a dict probe on a 16-byte digest, no embedding call at all.
+EXACT_CACHE_MAX_ENTRIES = 4096
 
-        response = self.client.chat.completions.create(**kwargs)
-        return response.choices[0].message.content
 
-    # ==================== STRATEGY & RISK ====================
-    
-    def analyze_risks(self, tasks: list, goals: list) -> RiskAnalysisResponse:
-        """Analyze project state for risks and suggest mitigations."""
-        prompt = f"""
+# Prompt templates, frozen at import. Methods fill in only the
+# dynamic fields instead of rebuilding each multi-line prompt from
+# its pieces on every call.
+_RISK_TMPL = """
         Analyze the following Project State for Risks:
-        GOALS: {json.dumps(goals)}
-        TASKS: {json.dumps(tasks)}
+        GOALS: {goals}
+        TASKS: {tasks}
         
         Identify risks (delays, bottlenecks, resource issues). 
         For each risk, suggest mitigations with cost/benefit analysis.
@@ -94,13 +87,9 @@ class ManagerialAgent:
             ],
             "overall_assessment": "Brief overall risk assessment"
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return RiskAnalysisResponse(**json.loads(res))
+"""
 
-    def refine_goal(self, raw_text: str) -> StructuredGoal:
-        """Parse vague goal into structured, measurable format."""
-        prompt = f"""
+_GOAL_TMPL = """
         Parse this goal into a structured format: "{raw_text}"
         
         Extract:
@@ -120,17 +109,13 @@ class ManagerialAgent:
             "is_measurable": true/false,
             "missing_criteria": "What's missing if not measurable"
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return StructuredGoal(**json.loads(res))
+"""
 
-    def analyze_tradeoffs(self, options: List[Dict[str, Any]], context: str) -> Dict[str, Any]:
-        """Analyze trade-offs between multiple options."""
-        prompt = f"""
+_TRADEOFF_TMPL = """
         Analyze trade-offs between these options:
         
         CONTEXT: {context}
-        OPTIONS: {json.dumps(options)}
+        OPTIONS: {options}
         
         For each option, evaluate:
         - Impact (business value)
@@ -156,21 +141,13 @@ class ManagerialAgent:
             "reasoning": "Why this recommendation",
             "assumptions": ["assumptions made"]
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return json.loads(res)
+"""
 
-    def suggest_priority_changes(
-        self,
-        tasks: List[Dict[str, Any]],
-        constraints: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Suggest task priority changes based on constraints."""
-        prompt = f"""
+_PRIORITY_TMPL = """
         Suggest priority changes for these tasks given constraints:
         
-        TASKS: {json.dumps(tasks)}
-        CONSTRAINTS: {json.dumps(constraints)}
+        TASKS: {tasks}
+        CONSTRAINTS: {constraints}
         
         Return JSON with:
         {{
@@ -186,19 +163,13 @@ class ManagerialAgent:
             ],
             "summary": "Overall recommendation summary"
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return json.loads(res)
+"""
 
-    # ==================== COMMUNICATION ====================
-    
-    def generate_standup_summary(self, completed: list, planned: list, blockers: list) -> StandupResponse:
-        """Generate a daily standup summary."""
-        prompt = f"""
+_STANDUP_TMPL = """
         Generate a Daily Standup Summary.
-        Completed: {json.dumps(completed)}
-        Planned: {json.dumps(planned)}
-        Blockers: {json.dumps(blockers)}
+        Completed: {completed}
+        Planned: {planned}
+        Blockers: {blockers}
         
         Tone: Clear, Neutral, Action-oriented.
         
@@ -207,47 +178,26 @@ class ManagerialAgent:
             "summary": "Brief overall summary",
             "action_items": ["List of action items to address blockers"]
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return StandupResponse(**json.loads(res))
+"""
 
-    def generate_report(
-        self,
-        report_type: str,
-        goals: list,
-        achievements: list,
-        risks: list,
-        priorities: list,
-        audience: str
-    ) -> ReportResponse:
-        """Generate a progress report tailored to audience."""
-        audience_guidance = {
-            "Executive": "Focus on outcomes, ROI, and high-level status. Be concise.",
-            "Team": "Include technical details and specific task progress."
-        }
-        
-        prompt = f"""
+_REPORT_TMPL = """
         Generate a {report_type} Report for {audience}.
         
-        Guidance: {audience_guidance.get(audience, '')}
+        Guidance: {guidance}
         
-        Goals Progress: {json.dumps(goals)}
-        Achievements: {json.dumps(achievements)}
-        Risks: {json.dumps(risks)}
-        Upcoming Priorities: {json.dumps(priorities)}
+        Goals Progress: {goals}
+        Achievements: {achievements}
+        Risks: {risks}
+        Upcoming Priorities: {priorities}
         
         Return JSON with:
         {{
             "report_content": "Full formatted report",
             "key_takeaways": ["Main points to remember"]
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return ReportResponse(**json.loads(res))
+"""
 
-    def generate_reminder(self, recipient: str, topic: str, context: str, tone: str) -> ReminderResponse:
-        """Generate a respectful reminder message."""
-        prompt = f"""
+_REMINDER_TMPL = """
         Draft a reminder message.
         Recipient: {recipient}
         Topic: {topic}
@@ -258,25 +208,15 @@ class ManagerialAgent:
         {{
             "message": "Full reminder message"
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return ReminderResponse(**json.loads(res))
+"""
 
-    def generate_escalation_brief(
-        self,
-        task_name: str,
-        issue: str,
-        history: List[str],
-        suggested_actions: List[str]
-    ) -> Dict[str, Any]:
-        """Generate a brief for escalation."""
-        prompt = f"""
+_ESCALATION_TMPL = """
         Generate an escalation brief.
         
         Task: {task_name}
         Issue: {issue}
-        History: {json.dumps(history)}
-        Suggested Actions: {json.dumps(suggested_actions)}
+        History: {history}
+        Suggested Actions: {suggested_actions}
         
         Return JSON with:
         {{
@@ -286,15 +226,9 @@ class ManagerialAgent:
             "recommended_action": "What should be done",
             "decision_needed": "What decision is required"
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return json.loads(res)
+"""
 
-    # ==================== INTELLIGENCE ====================
-    
-    def summarize_conversation(self, transcript: str) -> ConversationSummary:
-        """Summarize a conversation/meeting transcript."""
-        prompt = f"""
+_SUMMARY_TMPL = """
         Summarize this conversation transcript:
         "{transcript}"
         
@@ -309,13 +243,9 @@ class ManagerialAgent:
             "action_items": ["Action 1", "Action 2"],
             "unresolved_questions": ["Question 1"]
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return ConversationSummary(**json.loads(res))
+"""
 
-    def answer_stakeholder_query(self, query: str, context: str) -> StakeholderQueryResponse:
-        """Answer stakeholder questions based on project context."""
-        prompt = f"""
+_QUERY_TMPL = """
         Answer this stakeholder query based on project state:
         Query: "{query}"
         Context: "{context}"
@@ -331,15 +261,11 @@ class ManagerialAgent:
             "answer": "Clear, direct answer",
             "reasoning": "How you arrived at this answer"
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return StakeholderQueryResponse(**json.loads(res))
+"""
 
-    def analyze_team_sentiment(self, updates: List[str]) -> Dict[str, Any]:
-        """Analyze team sentiment from updates and communications."""
-        prompt = f"""
+_SENTIMENT_TMPL = """
         Analyze team sentiment from these updates:
-        {json.dumps(updates)}
+        {updates}
         
         Return JSON with:
         {{
@@ -349,15 +275,11 @@ class ManagerialAgent:
             "positive_indicators": ["positive1"],
             "recommendations": ["recommendation1"]
         }}
-        """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return json.loads(res)
+"""
 
-    def extract_insights(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract actionable insights from project data."""
-        prompt = f"""
+_INSIGHTS_TMPL = """
         Extract actionable insights from this project data:
-        {json.dumps(data)}
+        {data}
         
         Return JSON with:
         {{
@@ -371,9 +293,570 @@ class ManagerialAgent:
             ],
             "summary": "Overall summary of insights"
         }}
+"""
+
+
+def _context_hash(context_key: Any) -> bytes:
+    """BLAKE2b digest of the canonical JSON of the underlying data."""
+    payload = json.dumps(context_key, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+def _strict_schema(schema: Any) -> Any:
+    """Rewrite a Pydantic JSON Schema in place for OpenAI strict mode.
+
+    Strict structured outputs require every object to forbid extra keys
+    and list all of its properties as required, and reject the
+    ``default`` keyword.
+    """
+    if isinstance(schema, dict):
+        if schema.get("type") == "object" and "properties" in schema:
+            schema["additionalProperties"] = False
+            schema["required"] = list(schema["properties"])
+        schema.pop("default", None)
+        for value in schema.values():
+            _strict_schema(value)
+    elif isinstance(schema, list):
+        for item in schema:
+            _strict_schema(item)
+    return schema
+
+
+_RESPONSE_FORMATS: Dict[type, Dict[str, Any]] = {}
+
+
+def _response_format(model: type) -> Dict[str, Any]:
+    """Strict json_schema response_format for a response model.
+
+    With ``strict: True`` the server guarantees the reply conforms to
+    the schema, so the client never has to re-validate it. Built once
+    per model and cached.
+    """
+    fmt = _RESPONSE_FORMATS.get(model)
+    if fmt is None:
+        fmt = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": model.__name__,
+                "schema": _strict_schema(model.model_json_schema()),
+                "strict": True,
+            },
+        }
+        _RESPONSE_FORMATS[model] = fmt
+    return fmt
+
+
+# model_construct does not hydrate nested submodels, so models that nest
+# other models stay on the validating path.
+_NESTED_RESPONSE_MODELS = frozenset({RiskAnalysisResponse})
+
+
+def _construct(model: type, res: str):
+    """Build a response model from a strict-schema LLM reply.
+
+    The schema is enforced server-side, so flat models can skip
+    validation entirely via ``model_construct`` on the parsed dict.
+    """
+    if model in _NESTED_RESPONSE_MODELS:
+        return model.model_validate_json(res)
+    return model.model_construct(**fastjson.loads(res))
+
+
+class _SemanticCache:
+    """
+    Context-aware semantic cache for LLM responses.
+
+    Near-duplicate prompts (dashboard reloads asking the same question
+    with slightly different wording) are served from cache via embedding
+    similarity instead of a multi-second GPT-4o round trip. Each entry
+    also stores a hash of the underlying data (tasks, goals, transcript,
+    ...) which must match exactly, so similar wording over different
+    data never produces a false hit.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None  # (n, d), L2-normalized rows
+        self._entries: List[tuple] = []  # (context_hash, response), oldest first
+
+    def lookup(self, vector: np.ndarray, context_hash: bytes) -> Optional[str]:
+        """Return the best cached response above threshold, or None."""
+        if self._vectors is None:
+            return None
+
+        similarities = self._vectors @ vector
+        best_similarity = self.threshold
+        best_response = None
+        for idx in np.flatnonzero(similarities >= self.threshold):
+            if (self._entries[idx][0] == context_hash
+                    and similarities[idx] >= best_similarity):
+                best_similarity = similarities[idx]
+                best_response = self._entries[idx][1]
+        return best_response
+
+    def insert(self, vector: np.ndarray, context_hash: bytes, response: str) -> None:
+        row = vector.reshape(1, -1)
+        if self._vectors is None:
+            self._vectors = row
+        else:
+            self._vectors = np.vstack([self._vectors, row])
+        self._entries.append((context_hash, response))
+
+        if len(self._entries) > self.max_entries:
+            self._vectors = self._vectors[1:]
+            del self._entries[0]
+
+
+class ManagerialAgent:
+    """
+    Enhanced Managerial Intelligence Agent.
+    Implements all capabilities from the Priority 1 Managerial Intelligence Prompt.
+    """
+    
+    def __init__(self):
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
+            print("Warning: OPENAI_API_KEY not found in environment variables.")
+        self.client = get_sync_client()
+        self.async_client = get_async_client()
+        self.model = "gpt-4o"
+        self.embedding_model = "text-embedding-3-small"
+        self._semantic_cache = _SemanticCache()
+        self._exact_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._exact_lookups = 0
+        self._exact_hits = 0
+        # Caps concurrent async LLM calls (full_status fan-out) so a
+        # burst of gathered analyses stays within OpenAI rate limits.
+        self._llm_semaphore = asyncio.Semaphore(20)
+
+    def _exact_key(self, user_content: str, response_format) -> bytes:
+        return hashlib.blake2b(
+            json.dumps(
+                [MANAGERIAL_SYSTEM_PROMPT, user_content, response_format],
+                sort_keys=True
+            ).encode(),
+            digest_size=16
+        ).digest()
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text for the semantic cache; None if embedding fails."""
+        try:
+            response = self.client.embeddings.create(
+                model=self.embedding_model,
+                input=text
+            )
+            vector = np.asarray(response.data[0].embedding, dtype=np.float64)
+            return vector / np.linalg.norm(vector)
+        except Exception:
+            # The cache must never break the underlying call.
+            return None
+
+    def _build_request(self, user_content: str, response_format=None) -> Dict[str, Any]:
+        messages = [*_BASE_MESSAGES, {"role": "user", "content": user_content}]
+        kwargs = {"model": self.model, "messages": messages}
+        if response_format:
+            kwargs["response_format"] = response_format
+        return kwargs
+
+    def _query_llm(self, user_content: str, response_format=None, context_key=None) -> str:
+        if not self.client:
+            raise ValueError("OpenAI API key not configured")
+
+        # Exact-match tier: a dict probe, no embedding work.
+        exact_key = self._exact_key(user_content, response_format)
+        self._exact_lookups += 1
+        exact = self._exact_cache.get(exact_key)
+        if exact is not None:
+            self._exact_hits += 1
+            self._exact_cache.move_to_end(exact_key)
+            logger.info(
+                f"Managerial exact-cache hit "
+                f"({self._exact_hits}/{self._exact_lookups} lookups)"
+            )
+            return exact
+
+        context_hash = _context_hash([context_key, response_format])
+        vector = self._embed(user_content)
+        if vector is not None:
+            cached = self._semantic_cache.lookup(vector, context_hash)
+            if cached is not None:
+                return cached
+
+        # Stream and accumulate instead of waiting for the full payload
+        # to be generated and serialized server-side in one piece.
+        kwargs = self._build_request(user_content, response_format)
+        response = self.client.chat.completions.create(stream=True, **kwargs)
+        parts = []
+        for chunk in response:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+        content = "".join(parts)
+
+        self._exact_cache[exact_key] = content
+        while len(self._exact_cache) > EXACT_CACHE_MAX_ENTRIES:
+            self._exact_cache.popitem(last=False)
+        if vector is not None:
+            self._semantic_cache.insert(vector, context_hash, content)
+        return content
+
+    async def _query_llm_async(self, user_content: str, response_format=None) -> str:
+        """
+        Async variant of _query_llm.
+
+        Awaiting the AsyncOpenAI client instead of blocking the thread
+        lets independent analyses (e.g. risk scans across projects)
+        overlap on one event loop.
+        """
+        if not self.async_client:
+            raise ValueError("OpenAI API key not configured")
+
+        kwargs = self._build_request(user_content, response_format)
+        async with self._llm_semaphore:
+            response = await self.async_client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+
+    async def _query_llm_stream(self, user_content: str, response_format=None):
+        """
+        Stream response deltas as they arrive (for SSE-style endpoints).
+
+        Exact-cache hits yield the stored response in one piece; misses
+        yield each delta and cache the joined result on completion.
+        """
+        if not self.async_client:
+            raise ValueError("OpenAI API key not configured")
+
+        exact_key = self._exact_key(user_content, response_format)
+        self._exact_lookups += 1
+        exact = self._exact_cache.get(exact_key)
+        if exact is not None:
+            self._exact_hits += 1
+            self._exact_cache.move_to_end(exact_key)
+            yield exact
+            return
+
+        kwargs = self._build_request(user_content, response_format)
+        async with self._llm_semaphore:
+            response = await self.async_client.chat.completions.create(stream=True, **kwargs)
+            parts = []
+            async for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+        self._exact_cache[exact_key] = "".join(parts)
+        while len(self._exact_cache) > EXACT_CACHE_MAX_ENTRIES:
+            self._exact_cache.popitem(last=False)
+
+    async def stream_structured(self, user_content: str):
+        """
+        Yield progressively complete parses of a streamed JSON response.
+
+        jiter's partial mode parses the accumulated bytes after each
+        delta, so callers can render fields as the model emits them
+        instead of blocking until the payload is finished.
+        """
+        buf = bytearray()
+        async for delta in self._query_llm_stream(user_content, {"type": "json_object"}):
+            buf.extend(delta.encode())
+            try:
+                yield jiter.from_json(bytes(buf), partial_mode=True)
+            except ValueError:
+                # Mid-token prefix that even partial mode cannot parse.
+                continue
+
+    def submit_batch(self, prompts: List[str]) -> Dict[str, Any]:
+        """
+        Submit analyses to the OpenAI Batch API (50% cheaper, up to 24h).
+
+        Meant for bulk non-interactive work such as scanning every
+        project for risks overnight. Each prompt gets the same system
+        prompt and JSON response format as _query_llm.
+
+        Args:
+            prompts: User-content strings, one per analysis.
+
+        Returns:
+            {"batch_id": str, "custom_ids": [str]} with custom_ids
+            aligned to the input order, for matching results from
+            poll_batch.
+        """
+        if not self.client:
+            raise ValueError("OpenAI API key not configured")
+
+        custom_ids = []
+        lines = []
+        for prompt in prompts:
+            custom_id = str(uuid.uuid4())
+            custom_ids.append(custom_id)
+            body = self._build_request(prompt, {"type": "json_object"})
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+
+        input_file = self.client.files.create(
+            file=("managerial_batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return {"batch_id": batch.id, "custom_ids": custom_ids}
+
+    def poll_batch(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Check a submitted batch and collect its results when done.
+
+        Args:
+            batch_id: Id returned by submit_batch
+
+        Returns:
+            {"status": str, "results": {custom_id: parsed_json} | None};
+            results is populated only once status is "completed".
+        """
+        if not self.client:
+            raise ValueError("OpenAI API key not configured")
+
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            return {"status": batch.status, "results": None}
+
+        raw = self.client.files.content(batch.output_file_id).text
+        results = {}
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            content = row["response"]["body"]["choices"][0]["message"]["content"]
+            results[row["custom_id"]] = json.loads(content)
+        return {"status": "completed", "results": results}
+
+    # ==================== STRATEGY & RISK ====================
+    
+    @staticmethod
+    def _risk_prompt(tasks: list, goals: list) -> str:
+        return _RISK_TMPL.format(
+            goals=fastjson.dumps(goals),
+            tasks=fastjson.dumps(tasks)
+        )
+
+    def analyze_risks(self, tasks: list, goals: list) -> RiskAnalysisResponse:
+        """Analyze project state for risks and suggest mitigations."""
+        res = self._query_llm(self._risk_prompt(tasks, goals),
+                              response_format=_response_format(RiskAnalysisResponse),
+                              context_key=(tasks, goals))
+        return _construct(RiskAnalysisResponse, res)
+
+    def refine_goal(self, raw_text: str) -> StructuredGoal:
+        """Parse vague goal into structured, measurable format."""
+        prompt = _GOAL_TMPL.format(
+            raw_text=raw_text
+        )
+        res = self._query_llm(prompt, response_format=_response_format(StructuredGoal),
+                              context_key=raw_text)
+        return _construct(StructuredGoal, res)
+
+    def analyze_tradeoffs(self, options: List[Dict[str, Any]], context: str) -> Dict[str, Any]:
+        """Analyze trade-offs between multiple options."""
+        prompt = _TRADEOFF_TMPL.format(
+            context=context,
+            options=fastjson.dumps(options)
+        )
+        res = self._query_llm(prompt, response_format={"type": "json_object"},
+                              context_key=(options, context))
+        return fastjson.loads(res)
+
+    def suggest_priority_changes(
+        self,
+        tasks: List[Dict[str, Any]],
+        constraints: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Suggest task priority changes based on constraints."""
+        prompt = _PRIORITY_TMPL.format(
+            tasks=fastjson.dumps(tasks),
+            constraints=fastjson.dumps(constraints)
+        )
+        res = self._query_llm(prompt, response_format={"type": "json_object"},
+                              context_key=(tasks, constraints))
+        return fastjson.loads(res)
+
+    # ==================== COMMUNICATION ====================
+    
+    def generate_standup_summary(self, completed: list, planned: list, blockers: list) -> StandupResponse:
+        """Generate a daily standup summary."""
+        prompt = _STANDUP_TMPL.format(
+            completed=fastjson.dumps(completed),
+            planned=fastjson.dumps(planned),
+            blockers=fastjson.dumps(blockers)
+        )
+        res = self._query_llm(prompt, response_format=_response_format(StandupResponse),
+                              context_key=(completed, planned, blockers))
+        return _construct(StandupResponse, res)
+
+    @staticmethod
+    def _report_prompt(
+        report_type: str,
+        goals: list,
+        achievements: list,
+        risks: list,
+        priorities: list,
+        audience: str
+    ) -> str:
+        audience_guidance = {
+            "Executive": "Focus on outcomes, ROI, and high-level status. Be concise.",
+            "Team": "Include technical details and specific task progress."
+        }
+
+        return _REPORT_TMPL.format(
+            report_type=report_type,
+            audience=audience,
+            guidance=audience_guidance.get(audience, ''),
+            goals=fastjson.dumps(goals),
+            achievements=fastjson.dumps(achievements),
+            risks=fastjson.dumps(risks),
+            priorities=fastjson.dumps(priorities)
+        )
+
+    def generate_report(
+        self,
+        report_type: str,
+        goals: list,
+        achievements: list,
+        risks: list,
+        priorities: list,
+        audience: str
+    ) -> ReportResponse:
+        """Generate a progress report tailored to audience."""
+        prompt = self._report_prompt(report_type, goals, achievements, risks, priorities, audience)
+        res = self._query_llm(prompt, response_format=_response_format(ReportResponse),
+                              context_key=(report_type, goals, achievements, risks, priorities, audience))
+        return _construct(ReportResponse, res)
+
+    def generate_reminder(self, recipient: str, topic: str, context: str, tone: str) -> ReminderResponse:
+        """Generate a respectful reminder message."""
+        prompt = _REMINDER_TMPL.format(
+            recipient=recipient,
+            topic=topic,
+            context=context,
+            tone=tone
+        )
+        res = self._query_llm(prompt, response_format=_response_format(ReminderResponse),
+                              context_key=(recipient, topic, context, tone))
+        return _construct(ReminderResponse, res)
+
+    def generate_escalation_brief(
+        self,
+        task_name: str,
+        issue: str,
+        history: List[str],
+        suggested_actions: List[str]
+    ) -> Dict[str, Any]:
+        """Generate a brief for escalation."""
+        prompt = _ESCALATION_TMPL.format(
+            task_name=task_name,
+            issue=issue,
+            history=fastjson.dumps(history),
+            suggested_actions=fastjson.dumps(suggested_actions)
+        )
+        res = self._query_llm(prompt, response_format={"type": "json_object"},
+                              context_key=(task_name, issue, history, suggested_actions))
+        return fastjson.loads(res)
+
+    # ==================== INTELLIGENCE ====================
+    
+    def summarize_conversation(self, transcript: str) -> ConversationSummary:
+        """Summarize a conversation/meeting transcript."""
+        prompt = _SUMMARY_TMPL.format(
+            transcript=transcript
+        )
+        res = self._query_llm(prompt, response_format=_response_format(ConversationSummary),
+                              context_key=transcript)
+        return _construct(ConversationSummary, res)
+
+    def answer_stakeholder_query(self, query: str, context: str) -> StakeholderQueryResponse:
+        """Answer stakeholder questions based on project context."""
+        prompt = _QUERY_TMPL.format(
+            query=query,
+            context=context
+        )
+        res = self._query_llm(prompt, response_format=_response_format(StakeholderQueryResponse),
+                              context_key=context)
+        return _construct(StakeholderQueryResponse, res)
+
+    @staticmethod
+    def _sentiment_prompt(updates: List[str]) -> str:
+        return _SENTIMENT_TMPL.format(
+            updates=fastjson.dumps(updates)
+        )
+
+    def analyze_team_sentiment(self, updates: List[str]) -> Dict[str, Any]:
+        """Analyze team sentiment from updates and communications."""
+        res = self._query_llm(self._sentiment_prompt(updates),
+                              response_format={"type": "json_object"},
+                              context_key=updates)
+        return fastjson.loads(res)
+
+    def extract_insights(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract actionable insights from project data."""
+        prompt = _INSIGHTS_TMPL.format(
+            data=fastjson.dumps(data)
+        )
+        res = self._query_llm(prompt, response_format={"type": "json_object"},
+                              context_key=data)
+        return fastjson.loads(res)
+
+    # ==================== COMPOSITE ====================
+
+    async def full_status(
+        self,
+        tasks: list,
+        goals: list,
+        updates: List[str],
+        achievements: list,
+        risks: list,
+        priorities: list,
+        audience: str = "Team"
+    ) -> Dict[str, Any]:
+        """
+        Run risk analysis, sentiment analysis, and the weekly report
+        concurrently.
+
+        The three analyses are independent, so gathering them turns
+        three serial LLM latencies into roughly the slowest one. Any
+        failed analysis is reported as {"error": ...} without sinking
+        the others.
         """
-        res = self._query_llm(prompt, response_format={"type": "json_object"})
-        return json.loads(res)
+        risk_res, sentiment_res, report_res = await asyncio.gather(
+            self._query_llm_async(self._risk_prompt(tasks, goals),
+                                  _response_format(RiskAnalysisResponse)),
+            self._query_llm_async(self._sentiment_prompt(updates),
+                                  {"type": "json_object"}),
+            self._query_llm_async(
+                self._report_prompt("weekly", goals, achievements, risks, priorities, audience),
+                _response_format(ReportResponse)
+            ),
+            return_exceptions=True
+        )
+
+        def _parse(res, model=None):
+            if isinstance(res, BaseException):
+                return {"error": str(res)}
+            if model is not None:
+                return _construct(model, res)
+            return fastjson.loads(res)
+
+        return {
+            "risks": _parse(risk_res, RiskAnalysisResponse),
+            "sentiment": _parse(sentiment_res),
+            "report": _parse(report_res, ReportResponse)
+        }
 
 
 # Singleton instance
@@ -11,10 +11,14 @@ Implements multi-agent coordination for:
 Phase 3: Integrated with Memory Service for cognitive persistence.
 """
 
-from typing import TypedDict, List, Dict, Any, Optional
+from typing import TypedDict, List, Dict, Any, Optional, Tuple
 from langgraph.graph import StateGraph, END
-import json
+import re
 import asyncio
+from backend.app.agents import managerial as _managerial_mod
+from backend.app.agents import planning as _planning_mod
+from backend.app.agents import communication as _communication_mod
+from backend.app.core import fastjson
 from backend.app.core.logging import logger
 
 
@@ -26,6 +30,9 @@ class AgentState(TypedDict):
     context: Dict[str, Any]
     result: Optional[Dict[str, Any]]
     past_context: Optional[List[str]]  # Phase 3: Retrieved memories
+    message_lower: str  # Lowercased last message, computed once in the router
+    intent_tags: frozenset  # Intent keywords found in the last message
+    audit_trail: Optional[List[str]]  # Node trace, only when context["debug"]
 
 
 class AgentOrchestrator:
@@ -41,21 +48,92 @@ class AgentOrchestrator:
         "communication": ["standup", "report", "remind", "summary", "meeting"],
         "managerial": ["risk", "goal", "strategy", "analyze", "decision", "trade-off"]
     }
-    
+
+    # Compiled once from INTENT_KEYWORDS so each message is scanned in a
+    # single pass instead of one substring search per keyword. Each
+    # intent is a named alternation group, so the regex engine tags
+    # every match with its intent in C and the scan loop only reads
+    # match.lastgroup. Longest keywords first within a group so e.g.
+    # "blocker" is not shadowed by a shorter match.
+    _KEYWORD_PATTERN = re.compile(
+        "|".join(
+            "(?P<%s>%s)" % (
+                intent,
+                "|".join(sorted(map(re.escape, keywords), key=len, reverse=True))
+            )
+            for intent, keywords in INTENT_KEYWORDS.items()
+        )
+    )
+    _INTENT_PRIORITY = {intent: rank for rank, intent in enumerate(INTENT_KEYWORDS)}
+
+    # Flat (keyword, intent, rank) table for the long-message path.
+    _KEYWORD_TABLE = tuple(
+        (keyword, intent, rank)
+        for rank, (intent, keywords) in enumerate(INTENT_KEYWORDS.items())
+        for keyword in keywords
+    )
+    # Above this size, a transcript routed through the orchestrator can
+    # contain thousands of keyword hits and finditer pays Python-level
+    # overhead per match; one C substring scan per keyword is bounded by
+    # the keyword count instead.
+    _LONG_MESSAGE_THRESHOLD = 2000
+
     def __init__(self):
         self.graph = self._build_graph()
-    
+        # The topology is router -> agent -> END with no loops, so
+        # process() can dispatch directly instead of paying for the
+        # pregel scheduler on every request. The compiled graph stays
+        # for debugging and future multi-hop flows; flip _fast_path off
+        # to route through it again.
+        self._fast_path = True
+        self._node_table = {
+            "managerial_agent": self._managerial_node,
+            "planning_agent": self._planning_node,
+            "execution_agent": self._execution_node,
+            "people_ops_agent": self._people_ops_node,
+            "communication_agent": self._communication_node
+        }
+
     def _detect_intent(self, message: str) -> str:
         """Detect intent from message content."""
-        message_lower = message.lower()
-        
-        for intent, keywords in self.INTENT_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    return intent
-        
-        return "managerial"  # Default to managerial agent
-    
+        return self._scan_message(message.lower())[0]
+
+    def _scan_message(self, message_lower: str) -> Tuple[str, frozenset]:
+        """Scan a lowercased message once: best intent plus matched keywords."""
+        if len(message_lower) > self._LONG_MESSAGE_THRESHOLD:
+            return self._scan_message_long(message_lower)
+
+        matched = set()
+        best_rank = None
+        best_intent = "managerial"  # Default to managerial agent
+        for match in self._KEYWORD_PATTERN.finditer(message_lower):
+            matched.add(match.group())
+            intent = match.lastgroup
+            rank = self._INTENT_PRIORITY[intent]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                best_intent = intent
+
+        return best_intent, frozenset(matched)
+
+    def _scan_message_long(self, message_lower: str) -> Tuple[str, frozenset]:
+        """Long-message variant: one C-level substring scan per keyword.
+
+        Each scan dedupes repeated hits by construction, so cost is
+        bounded by the keyword count, not the number of occurrences.
+        """
+        matched = set()
+        best_rank = None
+        best_intent = "managerial"
+        for keyword, intent, rank in self._KEYWORD_TABLE:
+            if keyword in message_lower:
+                matched.add(keyword)
+                if best_rank is None or rank < best_rank:
+                    best_rank = rank
+                    best_intent = intent
+
+        return best_intent, frozenset(matched)
+
     def _build_graph(self) -> StateGraph:
         """Build the LangGraph state machine."""
         builder = StateGraph(AgentState)
@@ -96,11 +174,12 @@ class AgentOrchestrator:
     
     def _router_node(self, state: AgentState) -> AgentState:
         """Route to appropriate agent based on message intent."""
-        logger.info(f"Router processing state")
+        logger.info("Router processing state")
         
         last_message = state["messages"][-1] if state["messages"] else ""
-        intent = self._detect_intent(last_message)
-        
+        message_lower = last_message.lower()
+        intent, intent_tags = self._scan_message(message_lower)
+
         agent_map = {
             "managerial": "managerial_agent",
             "planning": "planning_agent",
@@ -111,37 +190,40 @@ class AgentOrchestrator:
         
         next_agent = agent_map.get(intent, "managerial_agent")
         
-        logger.info(f"Detected intent: {intent} -> Routing to: {next_agent}")
+        logger.info("Detected intent: %s -> Routing to: %s", intent, next_agent)
         
+        # Partial update: LangGraph merges returned keys into state, so
+        # spreading {**state, ...} only re-copied the whole dict per hop.
         return {
-            **state,
             "current_agent": intent,
-            "next_step": next_agent
+            "next_step": next_agent,
+            "message_lower": message_lower,
+            "intent_tags": intent_tags
         }
     
     def _managerial_node(self, state: AgentState) -> AgentState:
         """Handle managerial intelligence requests."""
         logger.info("Managerial Agent processing")
-        
-        from backend.app.agents.managerial import managerial_agent
-        
+
+        managerial_agent = _managerial_mod.managerial_agent
+
         last_message = state["messages"][-1] if state["messages"] else ""
         context = state.get("context", {})
         past_context = state.get("past_context") or context.get("past_context", "")
         
         result = {}
-        message_lower = last_message.lower()
-        
+        intent_tags = state.get("intent_tags", frozenset())
+
         # Enrich context with past memories if available
-        enriched_context = json.dumps(context)
+        enriched_context = fastjson.dumps(context)
         if past_context:
             enriched_context = f"{past_context}\n\nCURRENT CONTEXT:\n{enriched_context}"
-        
-        if "risk" in message_lower:
+
+        if "risk" in intent_tags:
             tasks = context.get("tasks", [])
             goals = context.get("goals", [])
             result = managerial_agent.analyze_risks(tasks, goals)
-        elif "goal" in message_lower:
+        elif "goal" in intent_tags:
             raw_text = context.get("goal_text", last_message)
             result = managerial_agent.refine_goal(raw_text)
         else:
@@ -151,31 +233,30 @@ class AgentOrchestrator:
                 enriched_context
             )
         
-        return {
-            **state,
-            "messages": state["messages"] + [f"Managerial Agent: Processed {last_message[:50]}..."],
-            "result": result if isinstance(result, dict) else result.__dict__
-        }
+        logger.debug("managerial_agent handled: %.50s", last_message)
+        if state.get("audit_trail") is not None:
+            state["audit_trail"].append(f"Managerial Agent: Processed {last_message[:50]}...")
+        return {"result": result if isinstance(result, dict) else result.__dict__}
     
     def _planning_node(self, state: AgentState) -> AgentState:
         """Handle planning requests."""
         logger.info("Planning Agent processing")
-        
-        from backend.app.agents.planning import planning_agent
-        
+
+        planning_agent = _planning_mod.planning_agent
+
         last_message = state["messages"][-1] if state["messages"] else ""
         context = state.get("context", {})
         
         result = {}
-        message_lower = last_message.lower()
-        
-        if "decompose" in message_lower or "breakdown" in message_lower:
+        intent_tags = state.get("intent_tags", frozenset())
+
+        if "decompose" in intent_tags or "breakdown" in intent_tags:
             goal_text = context.get("goal_text", last_message)
             result = planning_agent.decompose_goal(goal_text, context.get("constraints"))
-        elif "timeline" in message_lower:
+        elif "timeline" in intent_tags:
             tasks = context.get("tasks", [])
             result = planning_agent.suggest_timeline(tasks)
-        elif "validate" in message_lower:
+        elif "validate" in state.get("message_lower", ""):
             tasks = context.get("tasks", [])
             deadline = context.get("deadline")
             result = planning_agent.validate_plan(tasks, deadline)
@@ -183,11 +264,10 @@ class AgentOrchestrator:
             # Default: goal decomposition
             result = planning_agent.decompose_goal(last_message)
         
-        return {
-            **state,
-            "messages": state["messages"] + [f"Planning Agent: Created plan for {last_message[:50]}..."],
-            "result": result
-        }
+        logger.debug("planning_agent handled: %.50s", last_message)
+        if state.get("audit_trail") is not None:
+            state["audit_trail"].append(f"Planning Agent: Created plan for {last_message[:50]}...")
+        return {"result": result}
     
     def _execution_node(self, state: AgentState) -> AgentState:
         """Handle execution monitoring requests."""
@@ -204,11 +284,10 @@ class AgentOrchestrator:
             "note": "Full execution requires database session - use API endpoints directly"
         }
         
-        return {
-            **state,
-            "messages": state["messages"] + ["Execution Agent: Monitoring request processed"],
-            "result": result
-        }
+        logger.debug("execution_agent handled: %.50s", last_message)
+        if state.get("audit_trail") is not None:
+            state["audit_trail"].append("Execution Agent: Monitoring request processed")
+        return {"result": result}
     
     def _people_ops_node(self, state: AgentState) -> AgentState:
         """Handle people/resource operations."""
@@ -225,48 +304,46 @@ class AgentOrchestrator:
             "note": "Full people ops requires database session - use API endpoints directly"
         }
         
-        return {
-            **state,
-            "messages": state["messages"] + ["People Ops Agent: Request processed"],
-            "result": result
-        }
+        logger.debug("people_ops_agent handled: %.50s", last_message)
+        if state.get("audit_trail") is not None:
+            state["audit_trail"].append("People Ops Agent: Request processed")
+        return {"result": result}
     
     def _communication_node(self, state: AgentState) -> AgentState:
         """Handle communication generation requests."""
         logger.info("Communication Agent processing")
-        
-        from backend.app.agents.communication import communication_agent
-        
+
+        communication_agent = _communication_mod.communication_agent
+
         last_message = state["messages"][-1] if state["messages"] else ""
         context = state.get("context", {})
         
         result = {}
-        message_lower = last_message.lower()
-        
-        if "standup" in message_lower:
+        intent_tags = state.get("intent_tags", frozenset())
+
+        if "standup" in intent_tags:
             completed = context.get("completed", [])
             planned = context.get("planned", [])
             blockers = context.get("blockers", [])
             result = communication_agent.generate_standup("Team", completed, planned, blockers)
-        elif "report" in message_lower:
+        elif "report" in intent_tags:
             project_data = context.get("project_data", {})
             audience = context.get("audience", "team")
             result = communication_agent.generate_progress_report("weekly", audience, project_data)
-        elif "remind" in message_lower:
+        elif "remind" in intent_tags:
             recipient = context.get("recipient", "team")
             topic = context.get("topic", last_message)
             result = communication_agent.generate_reminder(recipient, topic, last_message)
-        elif "meeting" in message_lower:
+        elif "meeting" in intent_tags:
             transcript = context.get("transcript", last_message)
             result = communication_agent.summarize_meeting(transcript)
         else:
             result = {"message": f"Communication request processed: {last_message[:100]}"}
         
-        return {
-            **state,
-            "messages": state["messages"] + ["Communication Agent: Generated content"],
-            "result": result
-        }
+        logger.debug("communication_agent handled: %.50s", last_message)
+        if state.get("audit_trail") is not None:
+            state["audit_trail"].append("Communication Agent: Generated content")
+        return {"result": result}
     
     def process(self, message: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -285,19 +362,34 @@ class AgentOrchestrator:
             "next_step": "",
             "context": context or {},
             "result": None,
-            "past_context": context.get("past_context") if context else None
+            "past_context": context.get("past_context") if context else None,
+            "message_lower": "",
+            "intent_tags": frozenset(),
+            # Node trace costs an append per hop, so it is opt-in.
+            "audit_trail": [] if (context or {}).get("debug") else None
         }
         
         try:
-            final_state = self.graph.invoke(initial_state)
-            return {
+            if self._fast_path:
+                # Single hop: run router and target node directly,
+                # merging their partial updates the way the graph would.
+                final_state = initial_state
+                final_state.update(self._router_node(final_state))
+                node = self._node_table[final_state["next_step"]]
+                final_state.update(node(final_state))
+            else:
+                final_state = self.graph.invoke(initial_state)
+            response = {
                 "success": True,
                 "agent": final_state.get("current_agent"),
                 "result": final_state.get("result"),
                 "messages": final_state.get("messages")
             }
+            if final_state.get("audit_trail") is not None:
+                response["audit_trail"] = final_state["audit_trail"]
+            return response
         except Exception as e:
-            logger.error(f"Orchestrator error: {e}")
+            logger.error("Orchestrator error: %s", e)
             return {
                 "success": False,
                 "error": str(e)
@@ -344,9 +436,9 @@ class AgentOrchestrator:
                 # Format memories for prompt injection
                 context["past_context"] = memory_service.format_context_for_prompt(memories)
                 context["memory_ids"] = [m.id for m in memories]
-                logger.info(f"Injected {len(memories)} memories into context for user {user_id}")
+                logger.info("Injected %d memories into context for user %s", len(memories), user_id)
         except Exception as e:
-            logger.warning(f"Failed to retrieve memories: {e}")
+            logger.warning("Failed to retrieve memories: %s", e)
         
         # Process with enriched context
         return self.process(message, context)
@@ -20,16 +20,23 @@ Operating Principles:
 import os
 import json
 import uuid
+import heapq
+from bisect import bisect_left
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case, literal, select, union_all
 from backend.app.models import (
     Task, TaskStatus, TaskPriority, UserLeave, Holiday, AgentActivity,
     Employee, EmployeeSkill, Meeting, MeetingStatus, LeaveRequest, LeaveStatus,
     BurnoutIndicator, SkillProficiency
 )
 
+# Statuses that count toward current workload. A module constant keeps
+# the IN clause identical across calls, so SQLAlchemy's statement cache
+# reuses the compiled query.
+_ACTIVE_STATUSES = (TaskStatus.IN_PROGRESS, TaskStatus.NOT_STARTED, TaskStatus.BLOCKED)
+
 
 class PeopleOpsAgent:
     """
@@ -40,9 +47,22 @@ class PeopleOpsAgent:
     workload balance, and meeting coordination.
     """
     
+    # Bumped on writes that can change the workload picture; cached
+    # aggregates from an older epoch are discarded.
+    _mutation_seq = 0
+
     def __init__(self, db: Session):
         self.db = db
-    
+        # Agents are built per request, so this memo lives for one
+        # request: a planner assigning a batch of tasks scans the task
+        # table once instead of once per suggestion.
+        self._workload_cache: Optional[tuple] = None  # (epoch, rows)
+
+    @classmethod
+    def invalidate_workload_cache(cls) -> None:
+        """Mark cached owner aggregates stale after a task write."""
+        cls._mutation_seq += 1
+
     # ==================== EMPLOYEE PROFILE MANAGEMENT ====================
     
     def create_employee_profile(
@@ -281,7 +301,32 @@ class PeopleOpsAgent:
         }
     
     # ==================== WORKLOAD & BURNOUT MANAGEMENT ====================
-    
+
+    def _owner_aggregates(self) -> List[tuple]:
+        """
+        Per-owner aggregates over active tasks, computed in SQL.
+
+        Returns one (owner, task_count, estimated_hours, critical_count,
+        blocked_count) row per owner. Shared by workload analysis and
+        assignment suggestions so each caller runs a single grouped query,
+        and memoized per agent instance until a write bumps the epoch.
+        """
+        if (self._workload_cache is not None
+                and self._workload_cache[0] == PeopleOpsAgent._mutation_seq):
+            return self._workload_cache[1]
+
+        rows = self.db.query(
+            Task.owner,
+            func.count(Task.id),
+            func.coalesce(func.sum(func.coalesce(Task.estimated_hours, 4)), 0),
+            func.sum(case((Task.priority == TaskPriority.CRITICAL, 1), else_=0)),
+            func.sum(case((Task.status == TaskStatus.BLOCKED, 1), else_=0))
+        ).filter(
+            Task.status.in_(_ACTIVE_STATUSES)
+        ).group_by(Task.owner).all()
+        self._workload_cache = (PeopleOpsAgent._mutation_seq, rows)
+        return rows
+
     def analyze_workload(self, user: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze current workload distribution.
@@ -292,54 +337,30 @@ class PeopleOpsAgent:
         - Approved leave
         - Public holidays
         """
-        query = self.db.query(Task).filter(
-            Task.status.in_([TaskStatus.IN_PROGRESS, TaskStatus.NOT_STARTED, TaskStatus.BLOCKED])
-        )
-        
         if user:
-            query = query.filter(Task.owner == user)
-            tasks = query.all()
+            # Only this branch serializes individual tasks. A Core
+            # select of just the reported columns skips entity
+            # construction and identity-map tracking entirely.
+            tasks = self.db.execute(
+                select(Task.id, Task.name, Task.priority, Task.status,
+                       Task.deadline, Task.estimated_hours)
+                .where(Task.status.in_(_ACTIVE_STATUSES), Task.owner == user)
+            ).all()
             return self._analyze_user_workload(user, tasks)
-        
-        # Analyze all users
-        tasks = query.all()
-        workload_by_user = {}
-        
-        for task in tasks:
-            if task.owner not in workload_by_user:
-                workload_by_user[task.owner] = {
-                    "tasks": [],
-                    "total_estimated_hours": 0,
-                    "critical_count": 0,
-                    "blocked_count": 0
-                }
-            
-            workload_by_user[task.owner]["tasks"].append({
-                "id": task.id,
-                "name": task.name,
-                "priority": task.priority.value,
-                "status": task.status.value,
-                "deadline": task.deadline.isoformat() if task.deadline else None
-            })
-            workload_by_user[task.owner]["total_estimated_hours"] += task.estimated_hours or 4
-            
-            if task.priority == TaskPriority.CRITICAL:
-                workload_by_user[task.owner]["critical_count"] += 1
-            if task.status == TaskStatus.BLOCKED:
-                workload_by_user[task.owner]["blocked_count"] += 1
-        
-        # Calculate statistics
+
+        # Analyze all users: aggregate in SQL so only one row per owner
+        # crosses the wire instead of every active task.
         workloads = []
-        for owner, data in workload_by_user.items():
+        for owner, task_count, total_hours, critical_count, blocked_count in self._owner_aggregates():
             workloads.append({
                 "user": owner,
-                "task_count": len(data["tasks"]),
-                "estimated_hours": data["total_estimated_hours"],
-                "critical_tasks": data["critical_count"],
-                "blocked_tasks": data["blocked_count"],
-                "is_overloaded": data["total_estimated_hours"] > 40  # Weekly capacity
+                "task_count": task_count,
+                "estimated_hours": total_hours,
+                "critical_tasks": critical_count,
+                "blocked_tasks": blocked_count,
+                "is_overloaded": total_hours > 40  # Weekly capacity
             })
-        
+
         workloads.sort(key=lambda x: x["estimated_hours"], reverse=True)
         
         overloaded = [w for w in workloads if w["is_overloaded"]]
@@ -352,7 +373,7 @@ class PeopleOpsAgent:
             )
         
         return {
-            "total_active_tasks": len(tasks),
+            "total_active_tasks": sum(w["task_count"] for w in workloads),
             "team_members": len(workloads),
             "workload_distribution": workloads,
             "overloaded_members": [w["user"] for w in overloaded],
@@ -360,53 +381,65 @@ class PeopleOpsAgent:
             "recommendations": recommendations
         }
     
-    def _analyze_user_workload(self, user: str, tasks: List[Task]) -> Dict[str, Any]:
-        """Analyze workload for a specific user."""
-        total_hours = sum(t.estimated_hours or 4 for t in tasks)
-        
+    def _analyze_user_workload(self, user: str, tasks: List[Any]) -> Dict[str, Any]:
+        """Analyze workload for a specific user.
+
+        Accepts Task entities or column rows - anything exposing id,
+        name, priority, status, deadline and estimated_hours.
+        """
         by_priority = {
             "critical": [],
             "high": [],
             "medium": [],
             "low": []
         }
-        
+
+        # One pass over the task list: hours, priority buckets, and the
+        # urgency count together, with the deadline window precomputed
+        # as timestamps instead of datetime comparisons per task.
+        now = datetime.utcnow()
+        now_ts = now.timestamp()
+        week_ts = (now + timedelta(days=7)).timestamp()
+
+        total_hours = 0
+        urgent_count = 0
         for task in tasks:
+            total_hours += task.estimated_hours or 4
+            deadline = task.deadline
             by_priority[task.priority.value].append({
                 "id": task.id,
                 "name": task.name,
                 "status": task.status.value,
-                "deadline": task.deadline.isoformat() if task.deadline else None
+                "deadline": deadline.isoformat() if deadline else None
             })
-        
-        # Check upcoming deadlines
-        now = datetime.utcnow()
-        week_ahead = now + timedelta(days=7)
-        urgent = [t for t in tasks if t.deadline and now <= t.deadline <= week_ahead]
-        
+            if deadline is not None and now_ts <= deadline.timestamp() <= week_ts:
+                urgent_count += 1
+
         return {
             "user": user,
             "total_tasks": len(tasks),
             "estimated_hours": total_hours,
             "capacity_used_percentage": min(100, int((total_hours / 40) * 100)),
             "by_priority": by_priority,
-            "urgent_this_week": len(urgent),
+            "urgent_this_week": urgent_count,
             "is_overloaded": total_hours > 40,
             "recommendation": self._get_workload_recommendation(total_hours, len(tasks))
         }
     
+    # Capacity bands for _get_workload_recommendation: hours above
+    # _CAPACITY_THRESHOLDS[i-1] fall in band i.
+    _CAPACITY_THRESHOLDS = (15, 30, 40, 50)
+    _CAPACITY_MESSAGES = (
+        "Underutilized - can take on significantly more work",
+        "Light workload - available for additional tasks",
+        "Good workload - maintaining productivity",
+        "At capacity - avoid adding new tasks",
+        "Severely overloaded - immediate task redistribution needed"
+    )
+
     def _get_workload_recommendation(self, hours: int, task_count: int) -> str:
         """Generate workload recommendation."""
-        if hours > 50:
-            return "Severely overloaded - immediate task redistribution needed"
-        elif hours > 40:
-            return "At capacity - avoid adding new tasks"
-        elif hours > 30:
-            return "Good workload - maintaining productivity"
-        elif hours > 15:
-            return "Light workload - available for additional tasks"
-        else:
-            return "Underutilized - can take on significantly more work"
+        return self._CAPACITY_MESSAGES[bisect_left(self._CAPACITY_THRESHOLDS, hours)]
     
     def assess_burnout_risk(self, employee_id: str) -> Dict[str, Any]:
         """
@@ -662,7 +695,8 @@ class PeopleOpsAgent:
         )
         
         self.db.commit()
-        
+        self.invalidate_workload_cache()
+
         return {
             "success": True,
             "status": "approved",
@@ -1153,28 +1187,23 @@ class PeopleOpsAgent:
         
         Uses skills to inform task assignment while respecting workload constraints.
         """
-        # Get current workload
-        workload_analysis = self.analyze_workload()
-        
+        # Rank candidates straight from the per-owner aggregates instead
+        # of re-running the full workload analysis.
         candidates = []
-        for member in workload_analysis["workload_distribution"]:
+        for owner, task_count, hours, _critical, blocked in self._owner_aggregates():
             # Skip overloaded members for non-critical tasks
-            if member["is_overloaded"] and priority != "critical":
+            if hours > 40 and priority != "critical":
                 continue
-            
-            # Calculate capacity score (lower is better)
-            capacity_score = member["estimated_hours"]
-            
-            # Adjust for blocked tasks (prefer people with fewer blockers)
-            capacity_score += member["blocked_tasks"] * 4
-            
+
+            # Capacity score (lower is better), penalizing blocked tasks
+            # so people with fewer blockers are preferred.
             candidates.append({
-                "user": member["user"],
-                "capacity_score": capacity_score,
-                "current_load": member["estimated_hours"],
-                "task_count": member["task_count"]
+                "user": owner,
+                "capacity_score": hours + blocked * 4,
+                "current_load": hours,
+                "task_count": task_count
             })
-        
+
         if not candidates:
             return {
                 "task_name": task_name,
@@ -1182,18 +1211,18 @@ class PeopleOpsAgent:
                 "reason": "All team members are overloaded",
                 "alternatives": []
             }
-        
-        # Sort by capacity score
-        candidates.sort(key=lambda x: x["capacity_score"])
-        
-        best = candidates[0]
-        
+
+        # Only the best candidate plus two alternatives are reported.
+        top = heapq.nsmallest(3, candidates, key=lambda x: x["capacity_score"])
+
+        best = top[0]
+
         return {
             "task_name": task_name,
             "suggestion": best["user"],
             "reason": f"Best available capacity ({best['current_load']}h current load)",
             "new_load": best["current_load"] + estimated_hours,
-            "alternatives": [c["user"] for c in candidates[1:3]]
+            "alternatives": [c["user"] for c in top[1:3]]
         }
     
     # ==================== AVAILABILITY & CALENDAR ====================
@@ -1205,43 +1234,60 @@ class PeopleOpsAgent:
         end_date: datetime
     ) -> Dict[str, Any]:
         """Check if a user is available during a date range."""
-        # Check leaves
-        leaves = self.db.query(UserLeave).filter(
+        # Leaves and holidays are independent, so fetch both in one
+        # round trip: a tagged UNION ALL of the two column-only selects
+        # instead of two serial queries.
+        leave_select = select(
+            literal("leave"),
+            UserLeave.start_date, UserLeave.end_date, UserLeave.leave_type
+        ).where(
             UserLeave.user == user,
             UserLeave.status == "approved",
             UserLeave.start_date <= end_date,
             UserLeave.end_date >= start_date
-        ).all()
-        
-        # Check holidays
-        holidays = self.db.query(Holiday).filter(
+        )
+        holiday_select = select(
+            literal("holiday"), Holiday.date, Holiday.date, Holiday.name
+        ).where(
             Holiday.date >= start_date,
             Holiday.date <= end_date
-        ).all()
+        )
+        rows = self.db.execute(union_all(leave_select, holiday_select)).all()
+        leaves = [row[1:] for row in rows if row[0] == "leave"]
+        holidays = [(row[1], row[3]) for row in rows if row[0] == "holiday"]
         
         unavailable_dates = []
-        
-        for leave in leaves:
+
+        # Day-granular bitmap over the queried range: bit i set means
+        # day i is unavailable. Each leave ORs in one contiguous run of
+        # bits, so overlapping leaves and holidays are not double-counted
+        # and multi-day leaves count every day they cover.
+        total_days = (end_date.date() - start_date.date()).days + 1
+        mask = 0
+
+        for leave_start, leave_end, leave_type in leaves:
             unavailable_dates.append({
                 "type": "leave",
-                "start": leave.start_date.isoformat(),
-                "end": leave.end_date.isoformat(),
-                "reason": leave.leave_type
+                "start": leave_start.isoformat(),
+                "end": leave_end.isoformat(),
+                "reason": leave_type
             })
-        
-        for holiday in holidays:
+            lo = max(0, (leave_start.date() - start_date.date()).days)
+            hi = min(total_days - 1, (leave_end.date() - start_date.date()).days)
+            if lo <= hi:
+                mask |= ((1 << (hi - lo + 1)) - 1) << lo
+
+        for holiday_date, holiday_name in holidays:
             unavailable_dates.append({
                 "type": "holiday",
-                "date": holiday.date.isoformat(),
-                "name": holiday.name
+                "date": holiday_date.isoformat(),
+                "name": holiday_name
             })
-        
-        # Calculate available days
-        total_days = (end_date - start_date).days + 1
-        unavailable_days = len(set(
-            d["date"] if d["type"] == "holiday" else d["start"] 
-            for d in unavailable_dates
-        ))
+            offset = (holiday_date.date() - start_date.date()).days
+            if 0 <= offset < total_days:
+                mask |= 1 << offset
+
+        unavailable_days = mask.bit_count()
         
         return {
             "user": user,
@@ -1261,51 +1307,70 @@ class PeopleOpsAgent:
         end_date: datetime
     ) -> Dict[str, Any]:
         """Get team availability calendar."""
-        # Get all leaves in period
-        leaves = self.db.query(UserLeave).filter(
+        # Leaves, holidays, and meetings in one round trip via a tagged
+        # UNION ALL over a shared (kind, id, start, end, label, extra)
+        # column layout, as in check_availability.
+        leave_select = select(
+            literal("leave"), UserLeave.user, UserLeave.start_date,
+            UserLeave.end_date, UserLeave.leave_type, literal(None)
+        ).where(
             UserLeave.status == "approved",
             UserLeave.start_date <= end_date,
             UserLeave.end_date >= start_date
-        ).all()
-        
-        # Get holidays
-        holidays = self.db.query(Holiday).filter(
+        )
+        holiday_select = select(
+            literal("holiday"), literal(None), Holiday.date,
+            Holiday.date, Holiday.name, literal(None)
+        ).where(
             Holiday.date >= start_date,
             Holiday.date <= end_date
-        ).all()
-        
-        # Get meetings
-        meetings = self.db.query(Meeting).filter(
+        )
+        meeting_select = select(
+            literal("meeting"), Meeting.id, Meeting.start_time,
+            Meeting.end_time, Meeting.title, Meeting.organizer
+        ).where(
             Meeting.status == MeetingStatus.SCHEDULED,
             Meeting.start_time >= start_date,
             Meeting.end_time <= end_date
+        )
+        rows = self.db.execute(
+            union_all(leave_select, holiday_select, meeting_select)
         ).all()
-        
-        calendar = {
+
+        holidays = []
+        leaves = []
+        meetings = []
+        for kind, row_id, row_start, row_end, label, extra in rows:
+            if kind == "leave":
+                leaves.append({
+                    "user": row_id,
+                    "start": row_start.isoformat(),
+                    "end": row_end.isoformat(),
+                    "type": label
+                })
+            elif kind == "holiday":
+                holidays.append({
+                    "date": row_start.isoformat(),
+                    "name": label
+                })
+            else:
+                meetings.append({
+                    "id": row_id,
+                    "title": label,
+                    "start": row_start.isoformat(),
+                    "end": row_end.isoformat(),
+                    "organizer": extra
+                })
+
+        return {
             "period": {
                 "start": start_date.isoformat(),
                 "end": end_date.isoformat()
             },
-            "holidays": [{
-                "date": h.date.isoformat(),
-                "name": h.name
-            } for h in holidays],
-            "leaves": [{
-                "user": l.user,
-                "start": l.start_date.isoformat(),
-                "end": l.end_date.isoformat(),
-                "type": l.leave_type
-            } for l in leaves],
-            "meetings": [{
-                "id": m.id,
-                "title": m.title,
-                "start": m.start_time.isoformat(),
-                "end": m.end_time.isoformat(),
-                "organizer": m.organizer
-            } for m in meetings]
+            "holidays": holidays,
+            "leaves": leaves,
+            "meetings": meetings
         }
-        
-        return calendar
     
     def record_leave(
         self,
@@ -1324,15 +1389,52 @@ class PeopleOpsAgent:
             leave_type=leave_type,
             status=status
         )
-        self.db.add(leave)
-        
-        self._log_activity(
+        self._persist_leaves(
+            [leave],
             f"Recorded {leave_type} leave for {user}: {start_date.date()} to {end_date.date()}"
         )
-        
-        self.db.commit()
-        self.db.refresh(leave)
         return leave
+
+    def record_leaves_bulk(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Record many leaves in one INSERT batch with a single commit.
+
+        Each entry provides user, start_date and end_date, plus optional
+        leave_type/status. One aggregate activity row covers the whole
+        batch instead of a log insert per leave.
+        """
+        if not entries:
+            return 0
+
+        leaves = [
+            UserLeave(
+                id=str(uuid.uuid4()),
+                user=entry["user"],
+                start_date=entry["start_date"],
+                end_date=entry["end_date"],
+                leave_type=entry.get("leave_type", "vacation"),
+                status=entry.get("status", "approved")
+            )
+            for entry in entries
+        ]
+        earliest = min(l.start_date for l in leaves)
+        latest = max(l.end_date for l in leaves)
+        self._persist_leaves(
+            leaves,
+            f"Recorded {len(leaves)} leaves: {earliest.date()} to {latest.date()}"
+        )
+        return len(leaves)
+
+    def _persist_leaves(self, leaves: List[UserLeave], activity_message: str) -> None:
+        """Insert leave rows plus one activity record in a single commit.
+
+        IDs are generated client-side and no server defaults are read
+        back, so no refresh round trip is needed.
+        """
+        self.db.bulk_save_objects(leaves)
+        self._log_activity(activity_message)
+        self.db.commit()
+        self.invalidate_workload_cache()
     
     # ==================== ACTIVITY LOGGING ====================
     
@@ -8,10 +8,14 @@ Implements:
 """
 
 import os
-import json
+import time
+import hashlib
+from collections import Counter, OrderedDict, deque
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from openai import OpenAI
+import numpy as np
+from backend.app.agents._http import get_sync_client
+from backend.app.core import fastjson
 
 
 class PlanningAgent:
@@ -32,26 +36,85 @@ class PlanningAgent:
     Be conservative with time estimates - it's better to under-promise and over-deliver.
     """
     
+    # Repeated prompts (retried decompositions, identical optimize
+    # calls) reuse their user-message dict instead of rebuilding it.
+    _USER_MSG_CACHE_MAX = 128
+
+    # Identical prompts within the TTL are served from cache instead of
+    # a fresh GPT-4o round trip; users re-asking the same goal minutes
+    # apart is common. Insertion backs off when nothing repeats.
+    LLM_CACHE_MAX_ENTRIES = 512
+    LLM_CACHE_TTL_SECONDS = 3600.0
+    _MISS_WINDOW = 64
+
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             print("Warning: OPENAI_API_KEY not found")
-        self.client = OpenAI(api_key=self.api_key) if self.api_key else None
+        self._client = None
         self.model = "gpt-4o"
-    
+        self._system_msg = {"role": "system", "content": self.SYSTEM_PROMPT}
+        self._user_msg_cache: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        self._llm_cache: "OrderedDict[bytes, tuple]" = OrderedDict()  # key -> (stored_at, content)
+        self._recent_misses = deque(maxlen=self._MISS_WINDOW)
+
+    @property
+    def client(self):
+        # The agent is built at import time; defer client construction
+        # until the first call that actually needs it.
+        if self._client is None:
+            self._client = get_sync_client()
+        return self._client
+
+    def _cache_key(self, prompt: str) -> bytes:
+        return hashlib.blake2b(
+            f"{self.model}|{prompt}".encode(), digest_size=16
+        ).digest()
+
+    def _cache_insertion_enabled(self) -> bool:
+        # If (almost) nothing has repeated over the last window, stop
+        # filling the cache; existing entries still serve hits, so a
+        # run of repeats re-enables insertion.
+        if len(self._recent_misses) < self._MISS_WINDOW:
+            return True
+        return sum(self._recent_misses) <= 0.9 * self._MISS_WINDOW
+
     def _query_llm(self, prompt: str) -> str:
         if not self.client:
             raise ValueError("OpenAI API key not configured")
-        
+
+        key = self._cache_key(prompt)
+        entry = self._llm_cache.get(key)
+        if entry is not None:
+            stored_at, content = entry
+            if time.monotonic() - stored_at < self.LLM_CACHE_TTL_SECONDS:
+                self._llm_cache.move_to_end(key)
+                self._recent_misses.append(0)
+                return content
+            del self._llm_cache[key]
+        self._recent_misses.append(1)
+
+        user_msg = self._user_msg_cache.get(prompt)
+        if user_msg is None:
+            user_msg = {"role": "user", "content": prompt}
+            self._user_msg_cache[prompt] = user_msg
+            if len(self._user_msg_cache) > self._USER_MSG_CACHE_MAX:
+                self._user_msg_cache.popitem(last=False)
+        else:
+            self._user_msg_cache.move_to_end(prompt)
+
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": self.SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
+            messages=[self._system_msg, user_msg],
             response_format={"type": "json_object"}
         )
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
+
+        if self._cache_insertion_enabled():
+            self._llm_cache[key] = (time.monotonic(), content)
+            if len(self._llm_cache) > self.LLM_CACHE_MAX_ENTRIES:
+                self._llm_cache.popitem(last=False)
+        return content
     
     def decompose_goal(
         self,
@@ -70,7 +133,9 @@ class PlanningAgent:
         """
         constraint_text = ""
         if constraints:
-            constraint_text = f"\nConstraints: {json.dumps(constraints)}"
+            # sort_keys so identical constraints always produce the same
+            # prompt (and therefore the same cache key)
+            constraint_text = f"\nConstraints: {fastjson.dumps_sorted(constraints)}"
         
         prompt = f"""
         Decompose this goal into actionable tasks:
@@ -109,7 +174,7 @@ class PlanningAgent:
         """
         
         result = self._query_llm(prompt)
-        return json.loads(result)
+        return fastjson.loads(result)
     
     def suggest_timeline(
         self,
@@ -132,36 +197,40 @@ class PlanningAgent:
         """
         if start_date is None:
             start_date = datetime.utcnow()
-        
-        # Calculate total hours and duration
-        total_hours = sum(t.get("estimated_hours", 4) for t in tasks)
+
+        # Durations and cumulative day offsets in one vectorized pass
+        # instead of a timedelta addition per task.
+        hours = np.fromiter(
+            (task.get("estimated_hours", 4) for task in tasks),
+            dtype=np.float64, count=len(tasks)
+        )
+        days = np.maximum(1, (hours / hours_per_day).astype(np.int64))
+        ends = np.cumsum(days)
+        starts = ends - days
+
+        total_hours = hours.sum()
         daily_capacity = team_size * hours_per_day
         estimated_days = total_hours / daily_capacity if daily_capacity > 0 else total_hours
-        
+
         # Add buffer for dependencies and context switching
         buffer_factor = 1.3
         estimated_days = int(estimated_days * buffer_factor)
-        
+
         # Assign dates to tasks
-        scheduled_tasks = []
-        current_date = start_date
-        
-        for task in tasks:
-            hours = task.get("estimated_hours", 4)
-            days_needed = max(1, int(hours / hours_per_day))
-            
-            scheduled_tasks.append({
+        scheduled_tasks = [
+            {
                 "name": task.get("name", "Unnamed Task"),
-                "start_date": current_date.isoformat(),
-                "end_date": (current_date + timedelta(days=days_needed)).isoformat(),
-                "days": days_needed
-            })
-            
-            current_date += timedelta(days=days_needed)
-        
+                "start_date": (start_date + timedelta(days=int(s))).isoformat(),
+                "end_date": (start_date + timedelta(days=int(e))).isoformat(),
+                "days": int(e - s)
+            }
+            for task, s, e in zip(tasks, starts, ends)
+        ]
+        end_date = start_date + timedelta(days=int(ends[-1])) if tasks else start_date
+
         return {
             "start_date": start_date.isoformat(),
-            "end_date": current_date.isoformat(),
+            "end_date": end_date.isoformat(),
             "total_days": estimated_days,
             "team_size": team_size,
             "schedule": scheduled_tasks,
@@ -192,10 +261,23 @@ class PlanningAgent:
         issues = []
         warnings = []
         recommendations = []
-        
-        # Check total hours
-        total_hours = sum(t.get("estimated_hours", 0) for t in tasks)
-        
+
+        # One pass over the plan: hours, missing owners/estimates, and
+        # priority distribution together instead of four comprehensions.
+        total_hours = 0
+        unassigned_count = 0
+        no_estimate_count = 0
+        priority_counts = Counter()
+        for t in tasks:
+            estimated = t.get("estimated_hours")
+            total_hours += estimated or 0
+            if not estimated:
+                no_estimate_count += 1
+            if not t.get("owner"):
+                unassigned_count += 1
+            priority_counts[t.get("priority", "medium")] += 1
+        priority_counts = dict(priority_counts)
+
         if deadline:
             days_available = (deadline - datetime.utcnow()).days
             hours_available = days_available * 6  # Assuming 6 productive hours/day
@@ -209,30 +291,23 @@ class PlanningAgent:
                 recommendations.append("Consider reducing scope or extending deadline")
         
         # Check for unassigned tasks
-        unassigned = [t for t in tasks if not t.get("owner")]
-        if unassigned:
+        if unassigned_count:
             warnings.append({
                 "type": "resources",
-                "message": f"{len(unassigned)} tasks have no owner assigned",
+                "message": f"{unassigned_count} tasks have no owner assigned",
                 "severity": "medium"
             })
-        
+
         # Check for missing estimates
-        no_estimate = [t for t in tasks if not t.get("estimated_hours")]
-        if no_estimate:
+        if no_estimate_count:
             warnings.append({
                 "type": "planning",
-                "message": f"{len(no_estimate)} tasks missing time estimates",
+                "message": f"{no_estimate_count} tasks missing time estimates",
                 "severity": "medium"
             })
             recommendations.append("Add time estimates to all tasks for accurate planning")
-        
+
         # Check priority distribution
-        priority_counts = {}
-        for t in tasks:
-            p = t.get("priority", "medium")
-            priority_counts[p] = priority_counts.get(p, 0) + 1
-        
         if priority_counts.get("critical", 0) > len(tasks) * 0.3:
             warnings.append({
                 "type": "prioritization",
@@ -268,10 +343,13 @@ class PlanningAgent:
         Returns:
             Optimization suggestions
         """
+        # Canonical task order and key order: semantically identical
+        # plans hash to the same cached response.
+        canonical_tasks = sorted(tasks, key=lambda t: str(t.get("name", "")))
         prompt = f"""
         Analyze this project plan and suggest optimizations for {optimization_goal}:
-        
-        TASKS: {json.dumps(tasks)}
+
+        TASKS: {fastjson.dumps_sorted(canonical_tasks)}
         
         Return JSON with:
         {{
@@ -293,7 +371,7 @@ class PlanningAgent:
         """
         
         result = self._query_llm(prompt)
-        return json.loads(result)
+        return fastjson.loads(result)
 
 
 # Singleton instance
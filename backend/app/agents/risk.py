@@ -14,9 +14,8 @@ import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
-from openai import OpenAI
-import os
 
+from backend.app.agents._http import get_sync_client
 from backend.app.models import (
     Project, Task, TaskStatus, Risk, RiskLevel, DecisionLog, ProjectHealth, AgentAuditLog
 )
@@ -37,9 +36,7 @@ class RiskAgent:
     @property
     def llm_client(self):
         if self._llm_client is None:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if api_key:
-                self._llm_client = OpenAI(api_key=api_key)
+            self._llm_client = get_sync_client()
         return self._llm_client
     
     def assess_project_risk(self, project_id: str) -> Dict[str, Any]:
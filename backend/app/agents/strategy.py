@@ -14,9 +14,8 @@ import json
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from sqlalchemy.orm import Session
-from openai import OpenAI
-import os
 
+from backend.app.agents._http import get_sync_client
 from backend.app.models import (
     Goal, GoalStatus, KeyResult, Project, GoalTaskLink,
     Risk, RiskLevel, DecisionLog
@@ -38,9 +37,7 @@ class StrategyAgent:
     @property
     def llm_client(self):
         if self._llm_client is None:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if api_key:
-                self._llm_client = OpenAI(api_key=api_key)
+            self._llm_client = get_sync_client()
         return self._llm_client
     
     def create_goal_from_text(self, text: str, owner: str = None) -> Dict[str, Any]:
@@ -0,0 +1,36 @@
+"""
+Fast JSON helpers backed by orjson.
+
+The agents round-trip list/dict columns (skills, goals, tags, feedback)
+through JSON on every read and write; orjson parses and serializes these
+payloads several times faster than the stdlib. Falls back to stdlib json
+when orjson is not installed.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj) -> str:
+    """Serialize obj to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def dumps_sorted(obj) -> str:
+    """Serialize obj with sorted keys, for canonical/cacheable output."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, sort_keys=True)
+
+
+def loads(s):
+    """Deserialize a JSON string (or bytes) to a Python object."""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
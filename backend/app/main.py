@@ -45,6 +45,13 @@ app.include_router(platform.router)
 app.include_router(advanced.router)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared OpenAI HTTP pools."""
+    from backend.app.agents._http import close_clients
+    await close_clients()
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Text, Integer, Boolean, Table, Float, Index
+from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Text, Integer, Boolean, Table, Float, Index, text, event, DDL
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -356,6 +356,34 @@ class Task(Base):
     goal_links = relationship("GoalTaskLink", back_populates="task", cascade="all, delete-orphan")
     escalations = relationship("Escalation", back_populates="task", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Deadline/priority scans filtered by status (risk forecasting,
+        # early warnings) can use an index-only plan
+        Index('ix_tasks_status_deadline', 'status', 'deadline'),
+        Index('ix_tasks_status_priority', 'status', 'priority'),
+        # Project-scoped health aggregates filter on (project_id, status)
+        Index('ix_tasks_project_status', 'project_id', 'status'),
+        # Partial indexes covering the hot active-task scans: stale-task
+        # detection and execution-health aggregates skip the (typically
+        # dominant) completed/cancelled rows entirely
+        Index(
+            'ix_tasks_active_last_update', 'last_update_at',
+            postgresql_where=text("status IN ('IN_PROGRESS', 'BLOCKED')"),
+            sqlite_where=text("status IN ('IN_PROGRESS', 'BLOCKED')")
+        ),
+        Index(
+            'ix_tasks_active_deadline', 'deadline',
+            postgresql_where=text("status NOT IN ('COMPLETED', 'CANCELLED')"),
+            sqlite_where=text("status NOT IN ('COMPLETED', 'CANCELLED')")
+        ),
+        # Workload analysis groups active tasks by owner
+        Index(
+            'ix_tasks_status_owner', 'status', 'owner',
+            postgresql_where=text("status IN ('NOT_STARTED', 'IN_PROGRESS', 'BLOCKED')"),
+            sqlite_where=text("status IN ('NOT_STARTED', 'IN_PROGRESS', 'BLOCKED')")
+        ),
+    )
+
 
 class TaskDependency(Base):
     """Task dependency for DAG management."""
@@ -452,6 +480,11 @@ class Holiday(Base):
     applies_to = Column(String)  # all, or specific user
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Calendar and availability lookups filter on date ranges
+        Index('ix_holidays_date', 'date'),
+    )
+
 
 class UserLeave(Base):
     """User leave records for workload planning."""
@@ -465,6 +498,11 @@ class UserLeave(Base):
     status = Column(String, default="approved")  # pending, approved, rejected
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Availability checks filter approved leaves by date overlap
+        Index('ix_userleave_status_dates', 'status', 'start_date', 'end_date'),
+    )
+
 
 class DailyUpdate(Base):
     """Daily progress updates from task owners."""
@@ -678,6 +716,11 @@ class Candidate(Base):
     job_role = relationship("JobRole", back_populates="candidates")
     interviews = relationship("Interview", back_populates="candidate", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Stale-candidate scans filter on stage and updated_at
+        Index('ix_candidates_stage_updated', 'stage', 'updated_at'),
+    )
+
 
 class Interview(Base):
     """
@@ -796,6 +839,28 @@ class KnowledgeArticle(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+# Normalized copy of KnowledgeArticle.target_roles so role lookups can
+# use an index seek instead of a substring match on the JSON text
+article_target_roles = Table(
+    'article_target_roles',
+    Base.metadata,
+    Column('article_id', String, ForeignKey('knowledge_articles.id'), primary_key=True),
+    Column('role', String, primary_key=True, index=True)
+)
+
+
+# Full-text GIN index for knowledge base search on Postgres; other
+# dialects (the SQLite test database) keep the ILIKE scan
+event.listen(
+    KnowledgeArticle.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX ix_knowledge_articles_fts ON knowledge_articles "
+        "USING gin (to_tsvector('english', title || ' ' || content))"
+    ).execute_if(dialect="postgresql")
+)
+
+
 # ==================== PLATFORM & ENTERPRISE MODELS ====================
 
 class User(Base):